@@ -13,7 +13,7 @@
 # mientras que SoftI2C implementa el protocolo de comunicación I2C por software
 from machine import Pin, SoftI2C, PWM
 from hcsr04 import HCSR04  # Se importa la clase HCSR04 para controlar el sensor ultrasónico HC-SR04
-from logo import LOGO # Importa el logo desde el archivo logo.py
+from logo_vlsb import LOGO_VLSB, LOGO_ANCHO  # Se importa el logo ya empaquetado (generado con empaquetar_imagenes.py)
 import ssd1306 # Se importa el módulo ssd1306 para controlar la pantalla OLED
 import time # Se importa el módulo time para manejo de pausas y tiempos
 
@@ -198,18 +198,8 @@ oled = ssd1306.SSD1306_I2C(128, 64, i2c)
 # Función para imprimir el logo del Tecnológico
 def imprimir_logo():
     oled.fill(0)# Limpia la pantalla
-    # Recorre cada fila del logo
-    for y, fila in enumerate(LOGO):
-        x = 0 # Inicializa la posición horizontal (columna) en 0 para cada nueva fila
-        # Recorre cada byte de la fila actual (cada byte representa 8 píxeles horizontales)
-        for byte in fila:
-            # Procesa cada bit del byte actual (de izquierda a derecha, bits 7 a 0)
-            for bit in range(8):
-                # Extrae el valor del bit específico usando desplazamiento de bits y operación AND
-                pixel = (byte >> (7 - bit)) & 1
-                # Dibuja el píxel en la posición (x, y) con el valor extraído (0 para apagado, 1 para encendido)
-                oled.pixel(x, y, pixel)
-                x += 1 # Incrementa la posición horizontal para el siguiente píxel
+    # Copia el logo, ya en el formato de páginas de la pantalla, directo a su buffer (sin recorrerlo píxel por píxel)
+    oled.blit_pages(LOGO_VLSB, LOGO_ANCHO)
     oled.show() # Actualiza la pantalla para mostrar el logo
     time.sleep(5) # Pausa de 5 segundos para que el logo sea visible
 
@@ -35,47 +35,36 @@ adc.width(ADC.WIDTH_12BIT)  # Se configura la resolución a 12 bits (valores de
 # Variables para la configuración de la pantalla y almacenamiento de datos
 ancho_oled = 128 # Se define el ancho del OLED
 alto_oled = 64 # Se define el alto del OLED
-buffer = [0]*ancho_oled   # Buffer circular que almacena los últimos 128 valores de la gráfica
 
-# Función para mapear un valor de un rango a otro rango
-def map_value(val, in_min, in_max, out_min, out_max):
-    # Aplica regla de tres para convertir un valor de un rango de entrada a un rango de salida
-    # Fórmula: valor_salida = (valor_entrada - min_entrada) * (max_salida - min_salida) / (max_entrada - min_entrada) + min_salida
-    return int((val - in_min) * (out_max - out_min) / (in_max - in_min) + out_min)
+# Gráfica de barrido entre y=10 y y=53 (justo arriba del eje X) a la derecha del eje Y.
+# Cada lectura nueva solo modifica una columna, por lo que show() solo envía esa columna a la pantalla
+grafica = ssd1306.StripChart(oled, 1, 10, ancho_oled-1, alto_oled-20, 0, 4095)
 
 # Función para convertir el valor del ADC a voltaje real
 def adc_to_volt(adc_val):
     # Convierte el valor digital (0-4095) a voltaje (0-3.3V) usando regla de tres
     return (adc_val / 4095) * 3.3
 
+# Limpia la pantalla llenándola de negro
+oled.fill(0)
+
+# Dibuja los ejes del gráfico una sola vez, la gráfica de barrido no los borra
+oled.hline(0, alto_oled-10, ancho_oled, 1)  # Eje X horizontal en la parte inferior (10 píxeles desde abajo)
+oled.vline(0, 0, alto_oled-10, 1)           # Eje Y vertical en el lado izquierdo
+
 # Ciclo principal que se ejecuta continuamente
 while True:
     # Lee el valor analógico del potenciómetro (0-4095)
     lectura = adc.read()
-    # Convierte el valor ADC en una coordenada y de la pantalla, dejando márgenes de 10 píxeles arriba y abajo
-    # Los valores altos del ADC se mapean a la parte superior de la pantalla (y pequeña)
-    y = map_value(lectura, 0, 4095, alto_oled-10, 10)
-    # Agrega el nuevo valor al final del buffer y elimina el más antiguo (como en una cola FIFO)  
-    buffer.append(y)
-    buffer.pop(0) # Elimina el primer elemento para mantener el tamaño del buffer constante
-
-    # Limpia la pantalla llenándola de negro
-    oled.fill(0)
-
-    # Dibuja los ejes del gráfico
-    oled.hline(0, alto_oled-10, ancho_oled, 1)  # Eje X horizontal en la parte inferior (10 píxeles desde abajo)
-    oled.vline(0, 0, alto_oled-10, 1)           # Eje Y vertical en el lado izquierdo
-
-    # Dibuja la gráfica conectando puntos consecutivos con líneas
-    for x in range(1, ancho_oled):
-        # Conecta el punto anterior buffer[x-1] con el punto actual buffer[x] usando una línea
-        oled.line(x-1, buffer[x-1], x, buffer[x], 1)
+    # Agrega la lectura en la columna del cursor, los valores altos quedan en la parte superior
+    grafica.add(lectura)
 
     # Convierte la lectura actual a voltaje y la muestra en pantalla
     volt = adc_to_volt(lectura)
+    oled.fill_rect(60, 0, ancho_oled-60, 8, 0) # Borra solo el texto anterior del voltaje
     oled.text("{:.2f}V".format(volt), 60, 0) # Muestra el voltaje con 2 decimales en la posición (60, 0)
 
-     # Actualiza la pantalla para mostrar todos los elementos dibujados
+     # Actualiza la pantalla, solo se envían las columnas que cambiaron
     oled.show()
      # Pausa de 50 milisegundos antes de la siguiente lectura
     sleep_ms(50)
@@ -4,8 +4,11 @@
 # and https://github.com/CoreElectronics/CE-PiicoDev-MPU6050-MicroPython-Module
 
 from math import sqrt, atan2
-from machine import Pin, SoftI2C
-from time import sleep_ms
+from machine import Pin, I2C, SoftI2C
+from time import sleep_ms, ticks_us
+from struct import pack, unpack, unpack_from
+from array import array
+from micropython import schedule
 
 error_msg = "\nError \n"
 i2c_err_str = "ESP32 could not communicate with module at address 0x{:02X}, check wiring"
@@ -35,6 +38,15 @@ _GYR_RNG_500DEG = 0x08
 _GYR_RNG_1000DEG = 0x10
 _GYR_RNG_2000DEG = 0x18
 
+# Pre-defined digital low-pass filter settings (accel / gyro bandwidth)
+_DLPF_260HZ = 0x00 # 260 Hz / 256 Hz, gyro output rate 8 kHz
+_DLPF_184HZ = 0x01 # 184 Hz / 188 Hz, gyro output rate 1 kHz from here on
+_DLPF_94HZ = 0x02
+_DLPF_44HZ = 0x03
+_DLPF_21HZ = 0x04
+_DLPF_10HZ = 0x05
+_DLPF_5HZ = 0x06
+
 # MPU-6050 Registers
 _PWR_MGMT_1 = 0x6B
 
@@ -47,11 +59,44 @@ _GYRO_XOUT0 = 0x43
 _ACCEL_CONFIG = 0x1C
 _GYRO_CONFIG = 0x1B
 
+_SMPLRT_DIV = 0x19
+_CONFIG = 0x1A
+
+_FIFO_EN = 0x23
+_INT_PIN_CFG = 0x37
+_INT_ENABLE = 0x38
+_INT_STATUS = 0x3A
+_USER_CTRL = 0x6A
+_FIFO_COUNTH = 0x72
+_FIFO_R_W = 0x74
+
+# FIFO_EN bits
+_FIFO_TEMP = 0x80
+_FIFO_GYRO = 0x70 # XG, YG and ZG
+_FIFO_ACCEL = 0x08
+
+# USER_CTRL bits
+_USER_FIFO_EN = 0x40
+_USER_FIFO_RESET = 0x04
+
+# INT_PIN_CFG bits
+_INT_RD_CLEAR = 0x10
+
+# INT_ENABLE / INT_STATUS bits
+_INT_FIFO_OFLOW = 0x10
+_INT_DATA_RDY = 0x01
+
+# Size of the chip FIFO in bytes, a full FIFO has overflowed
+_FIFO_SIZE = 1024
+
 _maxFails = 3
 
 # Address
 _MPU6050_ADDRESS = 0x68
 
+# File in flash where save_calibration() keeps the offsets
+_CALIBRATION_FILE = "mpu6050.cal"
+
 def signedIntFromBytes(x, endian="big"):
     y = int.from_bytes(x, endian)
     if (y >= 0x8000):
@@ -67,10 +112,22 @@ class MPU6050(object):
         self._terminatingFailCount = 0
         
         # Initializing the I2C method for ESP32
-        # Pin assignment:
+        # bus: an existing I2C or SoftI2C object, e.g. a hardware I2C at 400 kHz that is
+        #      shared with the OLED display, or the id of the hardware I2C peripheral
+        #      to create on the sda/scl pins (400 kHz unless freq is given).
+        # Without bus a SoftI2C is created as before, 100 kHz unless freq is given.
+        # Default pin assignment:
         # SCL -> GPIO 22
         # SDA -> GPIO 21
-        self.i2c = SoftI2C(scl=Pin(22), sda=Pin(21), freq=100000)
+        if bus is None or isinstance(bus, int):
+            scl = Pin(22 if scl is None else scl)
+            sda = Pin(21 if sda is None else sda)
+            if bus is None:
+                self.i2c = SoftI2C(scl=scl, sda=sda, freq=freq or 100000)
+            else:
+                self.i2c = I2C(bus, scl=scl, sda=sda, freq=freq or 400000)
+        else:
+            self.i2c = bus
         
         # Initializing the I2C method for ESP8266
         # Pin assignment:
@@ -79,6 +136,18 @@ class MPU6050(object):
         # self.i2c = I2C(scl=Pin(5), sda=Pin(4))
         
         self.addr = addr
+        # Buffer for the burst read of accel, temperature and gyro (registers 0x3B-0x48)
+        self._burst = bytearray(14)
+        self._buf6 = memoryview(self._burst)[0:6]
+        self._reg = bytearray(2)
+        self._reg1 = memoryview(self._reg)[0:1]
+        self._fifo_frame = 0
+        self._fifo_len = 0
+        # Interrupts enabled in INT_ENABLE, shared by the FIFO and data ready features
+        self._int_enable = 0
+        # Bias subtracted from every scaled reading, in deg/s and g (see calibrate)
+        self.gyro_offset = array("f", [0.0, 0.0, 0.0])
+        self.accel_offset = array("f", [0.0, 0.0, 0.0])
         try:
             # Wake up the MPU-6050 since it starts in sleep mode
             self.i2c.writeto_mem(self.addr, _PWR_MGMT_1, bytes([0x00]))
@@ -89,6 +158,9 @@ class MPU6050(object):
             raise e
         self._accel_range = self.get_accel_range(True)
         self._gyro_range = self.get_gyro_range(True)
+        # Scale modifiers for the current ranges, only looked up again when a range changes
+        self._accel_scale = self._accel_scaler()
+        self._gyro_scale = self._gyro_scaler()
 
     def _readData(self, register):
         failCount = 0
@@ -126,6 +198,7 @@ class MPU6050(object):
     def set_accel_range(self, accel_range):
         self.i2c.writeto_mem(self.addr, _ACCEL_CONFIG, bytes([accel_range]))
         self._accel_range = accel_range
+        self._accel_scale = self._accel_scaler()
 
     # Gets the range the accelerometer is set to.
     # raw=True: Returns raw value from the ACCEL_CONFIG register
@@ -152,23 +225,12 @@ class MPU6050(object):
     # Returns dictionary data in g or m/s^2 (g=False)
     def read_accel_data(self, g = False):         
         accel_data = self._readData(_ACCEL_XOUT0)
-        accel_range = self._accel_range
-        scaler = None
-        if accel_range == _ACC_RNG_2G:
-            scaler = _ACC_SCLR_2G
-        elif accel_range == _ACC_RNG_4G:
-            scaler = _ACC_SCLR_4G
-        elif accel_range == _ACC_RNG_8G:
-            scaler = _ACC_SCLR_8G
-        elif accel_range == _ACC_RNG_16G:
-            scaler = _ACC_SCLR_16G
-        else:
-            print("Unkown range - scaler set to _ACC_SCLR_2G")
-            scaler = _ACC_SCLR_2G
+        scaler = self._accel_scale
+        bias = self.accel_offset
 
-        x = accel_data["x"] / scaler
-        y = accel_data["y"] / scaler
-        z = accel_data["z"] / scaler
+        x = accel_data["x"] / scaler - bias[0]
+        y = accel_data["y"] / scaler - bias[1]
+        z = accel_data["z"] / scaler - bias[2]
 
         if g is True:
             return {"x": x, "y": y, "z": z}
@@ -185,6 +247,7 @@ class MPU6050(object):
     def set_gyro_range(self, gyro_range):
         self.i2c.writeto_mem(self.addr, _GYRO_CONFIG, bytes([gyro_range]))
         self._gyro_range = gyro_range
+        self._gyro_scale = self._gyro_scaler()
 
     # Gets the range the gyroscope is set to.
     # raw=True: return raw value from GYRO_CONFIG register
@@ -211,25 +274,398 @@ class MPU6050(object):
     # Returns the read values in a dictionary.
     def read_gyro_data(self):
         gyro_data = self._readData(_GYRO_XOUT0)
+        scaler = self._gyro_scale
+        bias = self.gyro_offset
+
+        x = gyro_data["x"] / scaler - bias[0]
+        y = gyro_data["y"] / scaler - bias[1]
+        z = gyro_data["z"] / scaler - bias[2]
+
+        return {"x": x, "y": y, "z": z}
+
+    # Reads accelerometer, temperature and gyroscope in a single 14 byte burst
+    # (registers 0x3B-0x48) without the delay of _readData. All values come from the
+    # same sample. Returns a dictionary: "accel" in g or m/s^2 (g=False) like
+    # read_accel_data, "temp" in degC and "gyro" in deg/s.
+    def read_all(self, g = False):
+        data = self._burst
+        if not self._read_into(_ACCEL_XOUT0, data):
+            nan = float("NaN")
+            return {"accel": {"x": nan, "y": nan, "z": nan}, "temp": nan, "gyro": {"x": nan, "y": nan, "z": nan}}
+        scaler = self._accel_scale
+        bias = self.accel_offset
+        k = 1 if g else _GRAVITIY_MS2
+        accel = {"x": (signedIntFromBytes(data[0:2]) / scaler - bias[0]) * k,
+                 "y": (signedIntFromBytes(data[2:4]) / scaler - bias[1]) * k,
+                 "z": (signedIntFromBytes(data[4:6]) / scaler - bias[2]) * k}
+        temp = signedIntFromBytes(data[6:8]) / 340 + 36.53
+        scaler = self._gyro_scale
+        bias = self.gyro_offset
+        gyro = {"x": signedIntFromBytes(data[8:10]) / scaler - bias[0],
+                "y": signedIntFromBytes(data[10:12]) / scaler - bias[1],
+                "z": signedIntFromBytes(data[12:14]) / scaler - bias[2]}
+        return {"accel": accel, "temp": temp, "gyro": gyro}
+
+    # Low-level reads that decode into a caller-supplied array instead of building
+    # dictionaries, for polling at high rates without garbage collector pauses.
+    # out: array('f') for scaled values or, with raw=True, array('h') for the raw counts.
+    # They return False (leaving out untouched) when the I2C read fails.
+
+    # out[0:3] = accel x, y, z in g or m/s^2 (g=False)
+    def read_accel_into(self, out, g = False, raw = False):
+        if not self._read_into(_ACCEL_XOUT0, self._buf6):
+            return False
+        x, y, z = unpack_from(">hhh", self._burst)
+        if raw:
+            out[0] = x
+            out[1] = y
+            out[2] = z
+            return True
+        self._scale_accel(x, y, z, out, g)
+        return True
+
+    # out[0:3] = gyro x, y, z in deg/s
+    def read_gyro_into(self, out, raw = False):
+        if not self._read_into(_GYRO_XOUT0, self._buf6):
+            return False
+        x, y, z = unpack_from(">hhh", self._burst)
+        if raw:
+            out[0] = x
+            out[1] = y
+            out[2] = z
+            return True
+        scaler = self._gyro_scale
+        bias = self.gyro_offset
+        out[0] = x / scaler - bias[0]
+        out[1] = y / scaler - bias[1]
+        out[2] = z / scaler - bias[2]
+        return True
+
+    # out[0:7] = accel x, y, z, temperature [degC], gyro x, y, z from one burst read
+    def read_all_into(self, out, g = False, raw = False):
+        if not self._read_into(_ACCEL_XOUT0, self._burst):
+            return False
+        self._decode_into(self._burst, 0, out, g, raw)
+        return True
+
+    # Decodes one 14 byte accel/temp/gyro sample of data starting at offset into out
+    def _decode_into(self, data, offset, out, g, raw):
+        ax, ay, az, t, gx, gy, gz = unpack_from(">hhhhhhh", data, offset)
+        if raw:
+            out[0] = ax
+            out[1] = ay
+            out[2] = az
+            out[3] = t
+            out[4] = gx
+            out[5] = gy
+            out[6] = gz
+            return
+        self._scale_accel(ax, ay, az, out, g)
+        out[3] = t / 340 + 36.53
+        scaler = self._gyro_scale
+        bias = self.gyro_offset
+        out[4] = gx / scaler - bias[0]
+        out[5] = gy / scaler - bias[1]
+        out[6] = gz / scaler - bias[2]
+
+    # Scales the raw accel counts x, y, z into out[0:3] in g or m/s^2 (g=False), minus the bias
+    def _scale_accel(self, x, y, z, out, g):
+        scaler = self._accel_scale
+        bias = self.accel_offset
+        if g:
+            out[0] = x / scaler - bias[0]
+            out[1] = y / scaler - bias[1]
+            out[2] = z / scaler - bias[2]
+        else:
+            out[0] = (x / scaler - bias[0]) * _GRAVITIY_MS2
+            out[1] = (y / scaler - bias[1]) * _GRAVITIY_MS2
+            out[2] = (z / scaler - bias[2]) * _GRAVITIY_MS2
+
+    # Burst read of len(buf) bytes from register without delay, retried like _readData
+    def _read_into(self, register, buf):
+        failCount = 0
+        while failCount < _maxFails:
+            try:
+                self.i2c.readfrom_mem_into(self.addr, register, buf)
+                return True
+            except:
+                failCount = failCount + 1
+                self._failCount = self._failCount + 1
+        self._terminatingFailCount = self._terminatingFailCount + 1
+        print(i2c_err_str.format(self.addr))
+        return False
+
+    # Enables the hardware FIFO (1024 bytes) and allocates a ring buffer for `capacity`
+    # frames. Each frame holds, in register order and 2 bytes per value, accel x, y, z
+    # (accel=True), temperature (temp=True) and gyro x, y, z (gyro=True). The chip
+    # pushes one frame per sample (see the sample rate divider), so samples taken
+    # between reads are no longer lost and can be drained in bursts with fifo_drain().
+    def fifo_enable(self, accel = True, gyro = True, temp = False, capacity = 64):
+        self._fifo_accel = accel
+        self._fifo_temp = temp
+        self._fifo_gyro = gyro
+        self._fifo_frame = 6 * accel + 2 * temp + 6 * gyro
+        self._fifo_capacity = capacity
+        self._fifo_ring = bytearray(self._fifo_frame * capacity)
+        self._fifo_view = memoryview(self._fifo_ring)
+        self._fifo_head = 0 # next frame slot to write
+        self._fifo_len = 0 # frames waiting in the ring
+        self.fifo_overflows = 0
+        mask = (_FIFO_ACCEL if accel else 0) | (_FIFO_TEMP if temp else 0) | (_FIFO_GYRO if gyro else 0)
+        self.i2c.writeto_mem(self.addr, _FIFO_EN, bytes([mask]))
+        self._set_interrupts(self._int_enable | _INT_FIFO_OFLOW)
+        self.fifo_reset()
+
+    def fifo_disable(self):
+        self.i2c.writeto_mem(self.addr, _FIFO_EN, bytes([0x00]))
+        self.i2c.writeto_mem(self.addr, _USER_CTRL, bytes([0x00]))
+        self._set_interrupts(self._int_enable & ~_INT_FIFO_OFLOW)
+        self._fifo_frame = 0
+
+    # Empties the chip FIFO (the ring buffer keeps the frames already drained)
+    def fifo_reset(self):
+        self.i2c.writeto_mem(self.addr, _USER_CTRL, bytes([_USER_FIFO_EN | _USER_FIFO_RESET]))
+
+    # Returns the number of bytes waiting in the chip FIFO
+    def fifo_count(self):
+        self.i2c.readfrom_mem_into(self.addr, _FIFO_COUNTH, self._reg)
+        return (self._reg[0] << 8) | self._reg[1]
+
+    # Moves the complete frames waiting in the chip FIFO into the ring buffer with one
+    # burst read (two when the ring wraps around). Returns the number of frames read.
+    # On overflow the chip FIFO no longer holds whole frames, so it is reset, the event
+    # is counted in fifo_overflows and 0 is returned. The overflow flag is cleared by any
+    # read when data ready sampling is on (INT_RD_CLEAR), so a full FIFO counts as an
+    # overflow too. Frames that do not fit in the ring stay in the chip FIFO until the
+    # next call. Returns 0 while the FIFO is not enabled.
+    def fifo_drain(self, max_frames = None):
+        size = self._fifo_frame
+        if size == 0:
+            return 0
+        self.i2c.readfrom_mem_into(self.addr, _INT_STATUS, self._reg1)
+        status = self._reg[0]
+        count = self.fifo_count()
+        if status & _INT_FIFO_OFLOW or count >= _FIFO_SIZE:
+            self.fifo_reset()
+            self.fifo_overflows = self.fifo_overflows + 1
+            return 0
+        frames = min(count // size, self._fifo_capacity - self._fifo_len)
+        if max_frames is not None:
+            frames = min(frames, max_frames)
+        left = frames
+        while left:
+            head = self._fifo_head
+            n = min(left, self._fifo_capacity - head)
+            self.i2c.readfrom_mem_into(self.addr, _FIFO_R_W, self._fifo_view[head * size:(head + n) * size])
+            self._fifo_head = (head + n) % self._fifo_capacity
+            left = left - n
+        self._fifo_len = self._fifo_len + frames
+        return frames
+
+    # Returns the number of frames waiting in the ring buffer
+    def fifo_available(self):
+        return self._fifo_len
+
+    # Decodes the oldest frame of the ring buffer into out, using the layout of
+    # read_all_into (accel x, y, z, temperature, gyro x, y, z); slots of sensors that
+    # are not in the FIFO are left untouched. Returns False when the ring is empty.
+    def fifo_pop_into(self, out, g = False, raw = False):
+        if self._fifo_len == 0:
+            return False
+        size = self._fifo_frame
+        offset = ((self._fifo_head - self._fifo_len) % self._fifo_capacity) * size
+        self._fifo_len = self._fifo_len - 1
+        ring = self._fifo_ring
+        if self._fifo_accel:
+            x, y, z = unpack_from(">hhh", ring, offset)
+            offset = offset + 6
+            if raw:
+                out[0] = x
+                out[1] = y
+                out[2] = z
+            else:
+                self._scale_accel(x, y, z, out, g)
+        if self._fifo_temp:
+            t = unpack_from(">h", ring, offset)[0]
+            offset = offset + 2
+            out[3] = t if raw else t / 340 + 36.53
+        if self._fifo_gyro:
+            x, y, z = unpack_from(">hhh", ring, offset)
+            if raw:
+                out[4] = x
+                out[5] = y
+                out[6] = z
+            else:
+                scaler = self._gyro_scale
+                bias = self.gyro_offset
+                out[4] = x / scaler - bias[0]
+                out[5] = y / scaler - bias[1]
+                out[6] = z / scaler - bias[2]
+        return True
+
+    # Event driven sampling. The MPU6050 INT pin, wired to `pin` (a Pin or a GPIO
+    # number), pulses every time a new sample is ready. The Pin IRQ only records the
+    # time and schedules a burst read with micropython.schedule; the scheduled read
+    # decodes the sample into self.sample (layout of read_all_into) and calls
+    # callback(sample, timestamp_us) with the time taken at the interrupt.
+    # No fixed sleeps and exactly one read per new sample; interrupts that arrive
+    # while the previous read is still pending are counted in self.missed.
+    def enable_data_ready(self, pin, callback, g = False):
+        if not isinstance(pin, Pin):
+            pin = Pin(pin, Pin.IN)
+        self.sample = array("f", [0.0] * 7)
+        self.sample_time = 0
+        self.missed = 0
+        self._drdy_time = 0
+        self._drdy_pending = False
+        self._drdy_g = g
+        self._drdy_callback = callback
+        # bound method created once here, the interrupt handler must not allocate
+        self._drdy_read = self._read_data_ready
+        self._int_pin = pin
+        # INT active high and push-pull, 50 us pulse, status cleared by any read
+        self.i2c.writeto_mem(self.addr, _INT_PIN_CFG, bytes([_INT_RD_CLEAR]))
+        self._set_interrupts(self._int_enable | _INT_DATA_RDY)
+        # hard IRQ, so the timestamp is taken when the pulse arrives and not when a soft
+        # IRQ would get through the scheduler; _data_ready_irq does not allocate
+        pin.irq(trigger=Pin.IRQ_RISING, handler=self._data_ready_irq, hard=True)
+
+    def disable_data_ready(self):
+        self._int_pin.irq(handler=None)
+        self._set_interrupts(self._int_enable & ~_INT_DATA_RDY)
+
+    def _set_interrupts(self, mask):
+        self._int_enable = mask
+        self.i2c.writeto_mem(self.addr, _INT_ENABLE, bytes([mask]))
+
+    def _data_ready_irq(self, pin):
+        if self._drdy_pending:
+            self.missed = self.missed + 1
+            return
+        self._drdy_time = ticks_us()
+        self._drdy_pending = True
+        try:
+            schedule(self._drdy_read, 0)
+        except RuntimeError:
+            # schedule queue full
+            self._drdy_pending = False
+            self.missed = self.missed + 1
+
+    def _read_data_ready(self, _):
+        timestamp = self._drdy_time
+        self._drdy_pending = False
+        if self.read_all_into(self.sample, self._drdy_g):
+            self.sample_time = timestamp
+            self._drdy_callback(self.sample, timestamp)
+
+    # Scale modifier (LSB per g) for the current accelerometer range
+    def _accel_scaler(self):
+        accel_range = self._accel_range
+        if accel_range == _ACC_RNG_2G:
+            return _ACC_SCLR_2G
+        elif accel_range == _ACC_RNG_4G:
+            return _ACC_SCLR_4G
+        elif accel_range == _ACC_RNG_8G:
+            return _ACC_SCLR_8G
+        elif accel_range == _ACC_RNG_16G:
+            return _ACC_SCLR_16G
+        else:
+            print("Unkown range - scaler set to _ACC_SCLR_2G")
+            return _ACC_SCLR_2G
+
+    # Scale modifier (LSB per deg/s) for the current gyroscope range
+    def _gyro_scaler(self):
         gyro_range = self._gyro_range
-        scaler = None
         if gyro_range == _GYR_RNG_250DEG:
-            scaler = _GYR_SCLR_250DEG
+            return _GYR_SCLR_250DEG
         elif gyro_range == _GYR_RNG_500DEG:
-            scaler = _GYR_SCLR_500DEG
+            return _GYR_SCLR_500DEG
         elif gyro_range == _GYR_RNG_1000DEG:
-            scaler = _GYR_SCLR_1000DEG
+            return _GYR_SCLR_1000DEG
         elif gyro_range == _GYR_RNG_2000DEG:
-            scaler = _GYR_SCLR_2000DEG
+            return _GYR_SCLR_2000DEG
         else:
             print("Unkown range - scaler set to _GYR_SCLR_250DEG")
-            scaler = _GYR_SCLR_250DEG
+            return _GYR_SCLR_250DEG
 
-        x = gyro_data["x"] / scaler
-        y = gyro_data["y"] / scaler
-        z = gyro_data["z"] / scaler
+    # Sets the digital low-pass filter of accelerometer and gyroscope, so noise is
+    # filtered in the chip instead of in Python. Using a pre-defined _DLPF_* value is advised.
+    def set_dlpf(self, dlpf):
+        self.i2c.writeto_mem(self.addr, _CONFIG, bytes([dlpf & 0x07]))
 
-        return {"x": x, "y": y, "z": z}
+    # Gets the DLPF_CFG value the digital low-pass filter is set to
+    def get_dlpf(self):
+        return self.i2c.readfrom_mem(self.addr, _CONFIG, 1)[0] & 0x07
+
+    # Sets the output data rate [Hz] (of the data registers, the FIFO and the data
+    # ready interrupt) through the sample rate divider:
+    #   rate = gyro output rate / (1 + SMPLRT_DIV)
+    # where the gyro output rate is 8 kHz with the DLPF off (_DLPF_260HZ) and 1 kHz
+    # otherwise, so set the DLPF first. The accelerometer itself updates at 1 kHz at most.
+    # Returns the effective rate, which is the closest one the divider can produce.
+    def set_sample_rate(self, rate):
+        div = int(self._gyro_output_rate() / rate + 0.5) - 1
+        div = min(max(div, 0), 255)
+        self.i2c.writeto_mem(self.addr, _SMPLRT_DIV, bytes([div]))
+        return self.get_sample_rate()
+
+    # Reads back SMPLRT_DIV and the DLPF setting and returns the effective output data rate [Hz]
+    def get_sample_rate(self):
+        div = self.i2c.readfrom_mem(self.addr, _SMPLRT_DIV, 1)[0]
+        return self._gyro_output_rate() / (1 + div)
+
+    def _gyro_output_rate(self):
+        dlpf = self.get_dlpf()
+        return 8000 if dlpf == 0 or dlpf == 7 else 1000
+
+    # Measures the bias of the sensor, which must lie still (and flat, z up or down,
+    # when accel=True) while `samples` readings are averaged. The offsets are kept
+    # in deg/s and g in gyro_offset / accel_offset and subtracted from every scaled
+    # reading (raw=True readings are left as they are), so they stay valid when a
+    # range changes. accel=False only calibrates the gyroscope.
+    # Returns False when the sensor could not be read.
+    def calibrate(self, samples = 200, accel = True):
+        raw = array("h", [0] * 7)
+        sums = [0] * 7
+        for _ in range(samples):
+            if not self.read_all_into(raw, raw=True):
+                return False
+            for i in range(7):
+                sums[i] = sums[i] + raw[i]
+            sleep_ms(2)
+        scaler = self._gyro_scale
+        for i in range(3):
+            self.gyro_offset[i] = sums[4 + i] / samples / scaler
+        if accel:
+            scaler = self._accel_scale
+            for i in range(3):
+                self.accel_offset[i] = sums[i] / samples / scaler
+            # gravity is not a bias, keep 1 g on the vertical axis
+            self.accel_offset[2] = self.accel_offset[2] - (1 if sums[2] > 0 else -1)
+        return True
+
+    # Stores the offsets in flash so the next start does not need calibrate()
+    def save_calibration(self, path = _CALIBRATION_FILE):
+        with open(path, "wb") as f:
+            gyro = self.gyro_offset
+            accel = self.accel_offset
+            f.write(pack("<6f", gyro[0], gyro[1], gyro[2], accel[0], accel[1], accel[2]))
+
+    # Loads the offsets stored by save_calibration().
+    # Returns False (offsets untouched) when there is no valid calibration file.
+    def load_calibration(self, path = _CALIBRATION_FILE):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+        if len(data) != 24:
+            return False
+        values = unpack("<6f", data)
+        for i in range(3):
+            self.gyro_offset[i] = values[i]
+            self.accel_offset[i] = values[3 + i]
+        return True
 
     def read_angle(self): # returns radians. orientation matches silkscreen
         a=self.read_accel_data()
@@ -12,7 +12,7 @@ from machine import Pin, SoftI2C, ADC
 import ssd1306 # Se importa el módulo ssd1306 para controlar la pantalla OLED
 import dht # Se importa el módulo dht para manejar el sensor DHT11
 from time import sleep, ticks_ms, ticks_diff # Se importa sleep para crear pausas y ticks_ms/ticks_diff para medir tiempos
-from logo import LOGO  # Importa el logo desde el archivo logo.py
+from logo_vlsb import LOGO_VLSB, LOGO_ANCHO  # Se importa el logo ya empaquetado (generado con empaquetar_imagenes.py)
 
 # Configuración del I2C con los pines GPIO18 (SCL, línea de reloj) y GPI19 (SDA, línea de datos)
 i2c = SoftI2C(scl=Pin(18), sda=Pin(19))
@@ -205,20 +205,8 @@ def mostrar_integrantes():
     
     # Primero se muestra el logo durante 5 segundos
     oled.fill(0) # Limpia la pantalla
-    # Recorre cada fila del logo
-    for y, fila in enumerate(LOGO):
-        x = 0  # Inicializa la posición horizontal (columna) en 0 para cada nueva fila
-        # Recorre cada byte de la fila actual (cada byte representa 8 píxeles horizontales)
-        for byte in fila:
-            # Procesa cada bit del byte actual (de izquierda a derecha, bits 7 a 0)
-            for bit in range(8):
-                # Extrae el valor del bit específico usando desplazamiento de bits y operación AND
-                # (byte >> (7 - bit)) desplaza el byte hacia la derecha para posicionar el bit deseado en la posición 0
-                # & 1 aplica una máscara para obtener solo el valor del bit menos significativo (0 o 1)
-                pixel = (byte >> (7 - bit)) & 1
-                # Dibuja el píxel en la posición (x, y) con el valor extraído (0 para apagado, 1 para encendido)
-                oled.pixel(x, y, pixel)
-                x += 1 # Incrementa la posición horizontal para el siguiente píxel
+    # Copia el logo, ya en el formato de páginas de la pantalla, directo a su buffer (sin recorrerlo píxel por píxel)
+    oled.blit_pages(LOGO_VLSB, LOGO_ANCHO)
     oled.show() # Actualiza la pantalla para mostrar el logo dibujado
     print("Mostrando logo del Tecnológico...")
     
@@ -11,7 +11,7 @@
 # mientras que SoftI2C implementa el protocolo de comunicación I2C por software
 from machine import Pin, SoftI2C
 import ssd1306 # Se importa el módulo ssd1306 para controlar la pantalla OLED
-from logo import LOGO # Se importa el logo desde el archivo logo.py
+from logo_vlsb import LOGO_VLSB, LOGO_ANCHO # Se importa el logo ya empaquetado (generado con empaquetar_imagenes.py)
 
 # Configuración del I2C con los pines GPIO15 (SCL, línea de reloj) y GPIO4 (SDA, línea de datos)
 i2c = SoftI2C(scl=Pin(15), sda=Pin(4))
@@ -29,21 +29,9 @@ oled = ssd1306.SSD1306_I2C(oled_ancho, oled_alto, i2c)
 
 oled.fill(0)  # Limpia la pantalla llenándola de negro (valor 0)
 
-# Recorre cada fila del logo
-for y, fila in enumerate(LOGO):
-    x = 0 # Inicializa la posición horizontal (columna) en 0 para cada nueva fila
-
-    # Recorre cada byte de la fila actual (cada byte representa 8 píxeles horizontales)
-    for byte in fila:
-        # Procesa cada bit del byte actual (de izquierda a derecha, bits 7 a 0)  
-        for bit in range(8):
-            # Extrae el valor del bit específico usando desplazamiento de bits y operación AND
-            # (byte >> (7 - bit)) desplaza el byte hacia la derecha para posicionar el bit deseado en la posición 0
-            # & 1 aplica una máscara para obtener solo el valor del bit menos significativo (0 o 1)
-            pixel = (byte >> (7 - bit)) & 1  
-             # Dibuja el píxel en la posición (x, y) con el valor extraído (0 para apagado, 1 para encendido)
-            oled.pixel(x, y, pixel)
-            x += 1 # Incrementa la posición horizontal para el siguiente píxel
+# Copia el logo, ya en el formato de páginas de la pantalla (MONO_VLSB), directo a su buffer.
+# Sustituye el recorrido bit por bit con oled.pixel (8192 llamadas) por una copia de 8 páginas
+oled.blit_pages(LOGO_VLSB, LOGO_ANCHO)
 
 # Actualiza la pantalla para mostrar el logo dibujado
 oled.show()
\ No newline at end of file
@@ -0,0 +1,93 @@
+# Integrantes:
+# Samuel Jafet Juárez Baliño
+# Iván Alejandro Cadena López
+
+# Objetivo: Script que se ejecuta en la computadora (no en el ESP32) para convertir las imágenes del proyecto
+# al formato de páginas MONO_VLSB que usa internamente la pantalla SSD1306 y guardarlas como objetos bytes
+# inmutables en un módulo de Python. En el ESP32 la imagen se copia directo al buffer de la pantalla con
+# oled.blit_pages(), sin recorrerla bit por bit con oled.pixel.
+#
+# También comprime imágenes en un formato RLE (archivos .rle) que la pantalla decodifica directo a su buffer
+# con oled.load_rle() / oled.blit_rle(), ocupando mucha menos memoria que las matrices en listas de Python.
+#
+# Uso: python empaquetar_imagenes.py   (genera logo_vlsb.py y logo.rle a partir de logo.py)
+
+# Función para convertir una imagen MONO_HLSB (cada byte son 8 píxeles horizontales, bit 7 a la izquierda)
+# al formato MONO_VLSB (cada byte son 8 píxeles verticales de una página, bit 0 arriba)
+def hlsb_to_vlsb(data, width, height):
+    row_bytes = (width + 7) // 8
+    pages = (height + 7) // 8
+    out = bytearray(width * pages)
+    for y in range(height):
+        for x in range(width):
+            if (data[y * row_bytes + (x >> 3)] >> (7 - (x & 7))) & 1:
+                out[(y >> 3) * width + x] |= 1 << (y & 7)
+    return bytes(out)
+
+# Función para convertir una matriz de 0 y 1 (como los sprites e íconos del proyecto) al formato MONO_VLSB
+def matrix_to_vlsb(matrix):
+    width = len(matrix[0])
+    pages = (len(matrix) + 7) // 8
+    out = bytearray(width * pages)
+    for y, row in enumerate(matrix):
+        for x, pixel in enumerate(row):
+            if pixel:
+                out[(y >> 3) * width + x] |= 1 << (y & 7)
+    return bytes(out)
+
+# Función para comprimir una imagen MONO_VLSB con RLE
+# Formato: encabezado de 3 bytes (0x52 'R', ancho, número de páginas) seguido de paquetes:
+#   byte de control n < 128  -> siguen n+1 bytes literales
+#   byte de control n >= 128 -> el siguiente byte se repite n-126 veces (de 2 a 129)
+def rle_encode(data, width, pages):
+    if not 0 < width < 256 or not 0 < pages < 256:
+        raise ValueError("el ancho y las páginas deben estar entre 1 y 255")
+    out = bytearray((0x52, width, pages))
+    literal = bytearray()
+    i = 0
+    while i < len(data):
+        run = 1
+        while i + run < len(data) and run < 129 and data[i + run] == data[i]:
+            run += 1
+        if run >= 3 or (run == 2 and not literal):
+            if literal:
+                out.append(len(literal) - 1)
+                out += literal
+                literal = bytearray()
+            out.append(run + 126)
+            out.append(data[i])
+            i += run
+            continue
+        literal += data[i : i + run]
+        i += run
+        while len(literal) >= 128:
+            out.append(127)
+            out += literal[:128]
+            literal = literal[128:]
+    if literal:
+        out.append(len(literal) - 1)
+        out += literal
+    return bytes(out)
+
+# Función para escribir un módulo de Python con la imagen como literal bytes
+def write_module(path, name, data, width, height, source):
+    with open(path, "w") as f:
+        f.write("# Archivo generado por empaquetar_imagenes.py a partir de %s, no editar a mano\n" % source)
+        f.write("# Imagen de %dx%d píxeles en formato MONO_VLSB (páginas de 8 filas), lista para oled.blit_pages()\n\n" % (width, height))
+        f.write("%s_ANCHO = %d\n" % (name, width))
+        f.write("%s_ALTO = %d\n" % (name, height))
+        f.write("%s_VLSB = (\n" % name)
+        for i in range(0, len(data), 32):
+            f.write("    %r\n" % data[i : i + 32])
+        f.write(")\n")
+
+
+if __name__ == "__main__":
+    from logo import LOGO
+
+    logo = hlsb_to_vlsb(LOGO, 128, 64)
+    write_module("logo_vlsb.py", "LOGO", logo, 128, 64, "logo.py")
+    print("logo_vlsb.py generado")
+    with open("logo.rle", "wb") as f:
+        f.write(rle_encode(logo, 128, 8))
+    print("logo.rle generado")
@@ -0,0 +1,217 @@
+# Orientation filters for the MPU6050
+#
+# Fuse gyroscope and accelerometer samples into roll, pitch and yaw angles that
+# are updated incrementally, one sample at a time, instead of deriving the tilt
+# from a single accelerometer reading like MPU6050.read_angle(). The gyroscope
+# keeps the angles smooth and the accelerometer corrects their drift (yaw has no
+# reference and still drifts slowly).
+#
+# Samples use the layout of MPU6050.read_all_into() / fifo_pop_into():
+# accel x, y, z (any unit), temperature, gyro x, y, z in deg/s. The state lives
+# in preallocated arrays, update() creates no lists or dictionaries.
+#
+#   orientation = Madgwick()
+#   mpu.read_all_into(sample)
+#   orientation.update_at(sample, time.ticks_us())
+#   roll, pitch, yaw = orientation.angles
+
+from math import sqrt, atan2, asin, cos, sin
+from array import array
+from time import ticks_diff
+
+_DEG2RAD = 0.017453292519943295
+_RAD2DEG = 57.29577951308232
+
+
+class Orientation:
+    def __init__(self):
+        self.angles = array("f", [0.0, 0.0, 0.0])  # roll, pitch, yaw in degrees
+        self._sample = array("f", [0.0] * 7)
+        self.reset()
+
+    def reset(self):
+        self.angles[0] = self.angles[1] = self.angles[2] = 0.0
+        self.started = False
+        self._last_time = None
+
+    # Fuses one sample taken dt seconds after the previous one
+    def update(self, sample, dt):
+        if not self.started:
+            self.start(sample)
+            self.started = True
+            return
+        self.step(sample, dt)
+
+    # Fuses one sample taken at timestamp_us (time.ticks_us(), e.g. the timestamp
+    # passed by MPU6050.enable_data_ready), dt is the time since the previous call
+    def update_at(self, sample, timestamp_us):
+        last = self._last_time
+        self._last_time = timestamp_us
+        if last is None:
+            self.update(sample, 0.0)
+        else:
+            self.update(sample, ticks_diff(timestamp_us, last) / 1000000)
+
+    # Fuses every frame waiting in the FIFO ring buffer of mpu (see
+    # MPU6050.fifo_drain), frames are 1 / rate seconds apart. Returns the number
+    # of frames fused.
+    def update_fifo(self, mpu, rate):
+        dt = 1 / rate
+        sample = self._sample
+        count = 0
+        while mpu.fifo_pop_into(sample):
+            self.update(sample, dt)
+            count += 1
+        return count
+
+    # Initial angles from the accelerometer alone
+    def start(self, sample):
+        ax, ay, az = sample[0], sample[1], sample[2]
+        self.angles[0] = atan2(ay, az) * _RAD2DEG
+        self.angles[1] = atan2(-ax, sqrt(ay * ay + az * az)) * _RAD2DEG
+        self.angles[2] = 0.0
+
+    def step(self, sample, dt):
+        pass
+
+    def roll(self):
+        return self.angles[0]
+
+    def pitch(self):
+        return self.angles[1]
+
+    def yaw(self):
+        return self.angles[2]
+
+
+class Complementary(Orientation):
+    # Integrates the gyroscope and blends the result with the accelerometer tilt:
+    #   angle = alpha * (angle + rate * dt) + (1 - alpha) * accel_angle
+    # alpha close to 1 trusts the gyroscope more (smoother, slower drift correction)
+    def __init__(self, alpha=0.98):
+        self.alpha = alpha
+        super().__init__()
+
+    def step(self, sample, dt):
+        ax, ay, az = sample[0], sample[1], sample[2]
+        angles = self.angles
+        alpha = self.alpha
+        roll = angles[0] + sample[4] * dt
+        pitch = angles[1] + sample[5] * dt
+        if ax or ay or az:
+            acc_roll = atan2(ay, az) * _RAD2DEG
+            # keep the blend on the short side of the +-180 degree wrap
+            if acc_roll - roll > 180:
+                acc_roll -= 360
+            elif acc_roll - roll < -180:
+                acc_roll += 360
+            roll = alpha * roll + (1 - alpha) * acc_roll
+            acc_pitch = atan2(-ax, sqrt(ay * ay + az * az)) * _RAD2DEG
+            pitch = alpha * pitch + (1 - alpha) * acc_pitch
+        if roll > 180:
+            roll -= 360
+        elif roll < -180:
+            roll += 360
+        angles[0] = roll
+        angles[1] = pitch
+        yaw = angles[2] + sample[6] * dt
+        if yaw > 180:
+            yaw -= 360
+        elif yaw < -180:
+            yaw += 360
+        angles[2] = yaw
+
+
+class Madgwick(Orientation):
+    # Madgwick's gradient descent filter (IMU version, without magnetometer).
+    # The state is the quaternion q = (w, x, y, z); beta is the gain of the
+    # accelerometer correction, larger values correct drift faster but let more
+    # accelerometer noise through.
+    def __init__(self, beta=0.1):
+        self.beta = beta
+        self.q = array("f", [1.0, 0.0, 0.0, 0.0])
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        q = self.q
+        q[0] = 1.0
+        q[1] = q[2] = q[3] = 0.0
+
+    # Starts from the accelerometer tilt instead of converging from level
+    def start(self, sample):
+        super().start(sample)
+        half_roll = self.angles[0] * _DEG2RAD * 0.5
+        half_pitch = self.angles[1] * _DEG2RAD * 0.5
+        cr, sr = cos(half_roll), sin(half_roll)
+        cp, sp = cos(half_pitch), sin(half_pitch)
+        q = self.q
+        q[0] = cr * cp
+        q[1] = sr * cp
+        q[2] = cr * sp
+        q[3] = -sr * sp
+
+    def step(self, sample, dt):
+        q = self.q
+        q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+        gx = sample[4] * _DEG2RAD
+        gy = sample[5] * _DEG2RAD
+        gz = sample[6] * _DEG2RAD
+
+        # rate of change of the quaternion from the gyroscope
+        qd0 = 0.5 * (-q1 * gx - q2 * gy - q3 * gz)
+        qd1 = 0.5 * (q0 * gx + q2 * gz - q3 * gy)
+        qd2 = 0.5 * (q0 * gy - q1 * gz + q3 * gx)
+        qd3 = 0.5 * (q0 * gz + q1 * gy - q2 * gx)
+
+        ax, ay, az = sample[0], sample[1], sample[2]
+        norm = sqrt(ax * ax + ay * ay + az * az)
+        if norm:
+            ax /= norm
+            ay /= norm
+            az /= norm
+            # gradient of the error between the measured and the estimated gravity
+            _2q0 = 2 * q0
+            _2q1 = 2 * q1
+            _2q2 = 2 * q2
+            _2q3 = 2 * q3
+            _4q0 = 4 * q0
+            _4q1 = 4 * q1
+            _4q2 = 4 * q2
+            _8q1 = 8 * q1
+            _8q2 = 8 * q2
+            q0q0 = q0 * q0
+            q1q1 = q1 * q1
+            q2q2 = q2 * q2
+            q3q3 = q3 * q3
+            s0 = _4q0 * q2q2 + _2q2 * ax + _4q0 * q1q1 - _2q1 * ay
+            s1 = _4q1 * q3q3 - _2q3 * ax + 4 * q0q0 * q1 - _2q0 * ay - _4q1 + _8q1 * q1q1 + _8q1 * q2q2 + _4q1 * az
+            s2 = 4 * q0q0 * q2 + _2q0 * ax + _4q2 * q3q3 - _2q3 * ay - _4q2 + _8q2 * q1q1 + _8q2 * q2q2 + _4q2 * az
+            s3 = 4 * q1q1 * q3 - _2q1 * ax + 4 * q2q2 * q3 - _2q2 * ay
+            norm = sqrt(s0 * s0 + s1 * s1 + s2 * s2 + s3 * s3)
+            if norm:
+                beta = self.beta / norm
+                qd0 -= beta * s0
+                qd1 -= beta * s1
+                qd2 -= beta * s2
+                qd3 -= beta * s3
+
+        q0 += qd0 * dt
+        q1 += qd1 * dt
+        q2 += qd2 * dt
+        q3 += qd3 * dt
+        norm = sqrt(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3)
+        q[0] = q0 / norm
+        q[1] = q1 / norm
+        q[2] = q2 / norm
+        q[3] = q3 / norm
+        self._to_angles()
+
+    def _to_angles(self):
+        q0, q1, q2, q3 = self.q[0], self.q[1], self.q[2], self.q[3]
+        angles = self.angles
+        angles[0] = atan2(2 * (q0 * q1 + q2 * q3), 1 - 2 * (q1 * q1 + q2 * q2)) * _RAD2DEG
+        sinp = 2 * (q0 * q2 - q3 * q1)
+        angles[1] = asin(min(max(sinp, -1.0), 1.0)) * _RAD2DEG
+        angles[2] = atan2(2 * (q0 * q3 + q1 * q2), 1 - 2 * (q2 * q2 + q3 * q3)) * _RAD2DEG
+
@@ -0,0 +1,41 @@
+# Integrantes:
+# Samuel Jafet Juárez Baliño
+# Iván Alejandro Cadena López
+
+# Objetivo: Convertir una sola vez, al importar el módulo, los sprites de game_assets.py (matrices de 0 y 1)
+# en FrameBuffers empaquetados en formato MONO_VLSB, el mismo formato que usa la pantalla SSD1306.
+# Así cada sprite se dibuja con un solo oled.blit (código nativo) en lugar de 64 llamadas a oled.pixel.
+
+import framebuf # Se importa framebuf para crear los buffers de imagen de cada sprite
+import game_assets # Matrices originales de los sprites
+
+# Función para empaquetar una matriz de píxeles en un FrameBuffer MONO_VLSB
+def pack(matrix, factor=1):
+    # matrix: matriz bidimensional de 0 y 1
+    # factor: número de veces que se repite cada píxel (aumento de tamaño)
+    # Retorna: FrameBuffer listo para usarse con oled.blit
+
+    height = len(matrix) * factor
+    width = len(matrix[0]) * factor
+    # En MONO_VLSB cada byte guarda 8 píxeles verticales, por eso el alto se redondea a páginas de 8
+    buf = bytearray(((height + 7) // 8) * width)
+    sprite = framebuf.FrameBuffer(buf, width, height, framebuf.MONO_VLSB)
+    for y, row in enumerate(matrix):
+        for x, pixel in enumerate(row):
+            if pixel:
+                sprite.fill_rect(x * factor, y * factor, factor, factor, 1)
+    return sprite
+
+# Función para dibujar un sprite empaquetado en la pantalla
+def draw(oled, x, y, sprite, key=-1):
+    # key: color que se toma como transparente (0 deja ver el fondo), -1 dibuja el sprite completo
+    oled.blit(sprite, x, y, key)
+
+# Sprites empaquetados, con los mismos nombres que las matrices de game_assets.py
+enemy = pack(game_assets.enemy)
+aim = pack(game_assets.aim)
+qaim = pack(game_assets.qaim)
+bunker = pack(game_assets.bunker)
+
+# Mira rápida aumentada 3 veces (24x24 píxeles), se empaqueta una vez en lugar de escalarla cada cuadro
+qaim_x3 = pack(game_assets.qaim, 3)
@@ -0,0 +1,134 @@
+# Flush-cost benchmark for the SSD1306 driver, runs on a regular computer.
+# Replays typical frames of the projects (game, graph, logo) against the fake
+# buses in emulador.py and reports bytes and bus transactions per frame.
+#
+# Usage: python host/benchmark.py [frames]
+
+import os
+import random
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.dirname(HERE)]
+
+import emulador  # noqa: E402  (patches time with the MicroPython ticks functions)
+import ssd1306  # noqa: E402
+import game_sprites  # noqa: E402
+from logo_vlsb import LOGO_VLSB, LOGO_ANCHO  # noqa: E402
+
+
+def game_frames(oled):
+    # losbunkersFinal main loop: 9 bunkers, 9 falling enemies, the aim and the score
+    enemies = [[rail * 14 + 7, 0] for rail in range(9)]
+    x, y = 61, 26
+    points = 0
+    while True:
+        oled.fill(0)
+        for rail in range(9):
+            oled.blit(game_sprites.bunker, rail * 14 + 7, 55)
+        for enemy in enemies:
+            oled.blit(game_sprites.enemy, enemy[0], enemy[1])
+        enemy = random.choice(enemies)
+        enemy[1] = enemy[1] + random.randint(1, 2) if enemy[1] < 46 else 0
+        x = min(121, max(2, x + random.choice((-3, 0, 3))))
+        y = min(49, max(2, y + random.choice((-3, 0, 3))))
+        oled.blit(game_sprites.aim, x - 4, y - 4)
+        points += random.random() < 0.1
+        oled.text("P:%d" % points, 0, 0)
+        yield
+
+
+def graph_frames(oled):
+    # GraficaciónVoltaje with the sweep StripChart and the voltage label
+    oled.fill(0)
+    oled.hline(0, 54, 128, 1)
+    oled.vline(0, 0, 54, 1)
+    chart = ssd1306.StripChart(oled, 1, 10, 127, 44, 0, 4095)
+    reading = 2048
+    while True:
+        reading = min(4095, max(0, reading + random.randint(-200, 200)))
+        chart.add(reading)
+        oled.fill_rect(60, 0, 68, 8, 0)
+        oled.text("{:.2f}V".format(reading / 4095 * 3.3), 60, 0)
+        yield
+
+
+def redraw_graph_frames(oled):
+    # the original graph loop: clear, redraw axes and 127 segments every sample
+    samples = [32] * 128
+    while True:
+        samples.append(random.randint(10, 54))
+        samples.pop(0)
+        oled.fill(0)
+        oled.hline(0, 54, 128, 1)
+        oled.vline(0, 0, 54, 1)
+        for x in range(1, 128):
+            oled.line(x - 1, samples[x - 1], x, samples[x], 1)
+        oled.text("{:.2f}V".format(samples[-1] / 64 * 3.3), 60, 0)
+        yield
+
+
+def logo_frames(oled):
+    # splash screen alternating with a text screen, as in MonitoreoAmbiental
+    while True:
+        oled.fill(0)
+        oled.blit_pages(LOGO_VLSB, LOGO_ANCHO)
+        yield
+        oled.fill(0)
+        oled.text("Sist.Programables", 0, 0)
+        oled.text("Equipo:", 0, 20)
+        yield
+
+
+SCENES = (
+    ("game", game_frames),
+    ("graph", graph_frames),
+    ("graph redraw", redraw_graph_frames),
+    ("logo", logo_frames),
+)
+
+
+def i2c_display(page_mode=False):
+    bus = emulador.FakeI2C()
+    oled = ssd1306.SSD1306_I2C(128, 64, bus)
+    if page_mode:
+        oled.set_page_mode()
+    return oled, bus.counters, bus.devices[0x3C]
+
+
+def spi_display():
+    dc, res, cs = emulador.FakePin(), emulador.FakePin(), emulador.FakePin()
+    bus = emulador.FakeSPI(dc, cs)
+    oled = ssd1306.SSD1306_SPI(128, 64, bus, dc, res, cs)
+    return oled, bus.counters, bus.device
+
+
+def run(scene, make_display, frames, full=False):
+    random.seed(1)
+    oled, counters, device = make_display()
+    counters.reset()
+    frame = scene(oled)
+    for _ in range(frames):
+        next(frame)
+        oled.show(full)
+        if not emulador.same_image(oled, device):
+            raise AssertionError("panel RAM differs from the framebuffer")
+    return counters.bytes / frames, counters.transactions / frames
+
+
+def main(frames=200):
+    configs = (
+        ("i2c full show", lambda: i2c_display(), True),
+        ("i2c horizontal", lambda: i2c_display(), False),
+        ("i2c page mode", lambda: i2c_display(True), False),
+        ("spi horizontal", spi_display, False),
+    )
+    print("%-14s %-16s %12s %14s" % ("frame", "bus", "bytes/frame", "transfers/frame"))
+    for name, scene in SCENES:
+        for label, make_display, full in configs:
+            nbytes, transactions = run(scene, make_display, frames, full)
+            print("%-14s %-16s %12.1f %14.1f" % (name, label, nbytes, transactions))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,184 @@
+# Host-side SSD1306 emulator: fake I2C/SPI buses that decode the command
+# stream into a virtual GDDRAM and count bytes and bus transactions.
+
+import time
+
+# MicroPython's time functions that CPython lacks
+if not hasattr(time, "ticks_us"):
+    time.ticks_us = lambda: time.perf_counter_ns() // 1000
+    time.ticks_ms = lambda: time.perf_counter_ns() // 1000000
+    time.ticks_add = lambda t, delta: t + delta
+    time.ticks_diff = lambda a, b: a - b
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    time.sleep_us = lambda us: time.sleep(us / 1000000)
+
+# number of argument bytes that follow each multi-byte command
+_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5,
+    0x81: 1, 0x8D: 1, 0xA3: 2, 0xA8: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1,
+    0xDA: 1, 0xDB: 1,
+}
+
+
+class GDDRAM:
+    # virtual SSD1306 controller: display RAM plus address pointers
+    def __init__(self, width=128, pages=8):
+        self.width = width
+        self.pages = pages
+        self.ram = bytearray(width * pages)
+        self.mode = 0x02  # page addressing after reset
+        self.col_start, self.col_end = 0, width - 1
+        self.page_start, self.page_end = 0, pages - 1
+        self.col = 0
+        self.page = 0
+        self.start_line = 0
+        self.display_on = False
+        self.scrolling = False
+        self.inverted = False
+        self.contrast = 0x7F
+        self.commands = []
+        self._pending = []
+
+    def command(self, byte):
+        pending = self._pending
+        pending.append(byte)
+        need = _ARGS.get(pending[0], 0)
+        if len(pending) <= need:
+            return
+        self._pending = []
+        self.commands.append(tuple(pending))
+        self._execute(pending[0], pending[1:])
+
+    def _execute(self, cmd, args):
+        if cmd == 0x20:
+            self.mode = args[0] & 0x03
+        elif cmd == 0x21:
+            self.col_start, self.col_end = args[0], args[1]
+            self.col = args[0]
+        elif cmd == 0x22:
+            self.page_start, self.page_end = args[0] & 7, args[1] & 7
+            self.page = self.page_start
+        elif 0xB0 <= cmd <= 0xB7:
+            self.page = cmd & 0x07
+        elif cmd <= 0x0F:
+            self.col = (self.col & 0xF0) | cmd
+        elif cmd <= 0x1F:
+            self.col = (self.col & 0x0F) | ((cmd & 0x0F) << 4)
+        elif 0x40 <= cmd <= 0x7F:
+            self.start_line = cmd & 0x3F
+        elif cmd == 0x2E:
+            self.scrolling = False
+        elif cmd == 0x2F:
+            self.scrolling = True
+        elif cmd == 0xAE or cmd == 0xAF:
+            self.display_on = cmd == 0xAF
+        elif cmd == 0xA6 or cmd == 0xA7:
+            self.inverted = cmd == 0xA7
+        elif cmd == 0x81:
+            self.contrast = args[0]
+
+    def data(self, byte):
+        if self.col < self.width and self.page < self.pages:
+            self.ram[self.page * self.width + self.col] = byte
+        if self.mode == 0x02:
+            self.col = self.col + 1 if self.col < self.width - 1 else 0
+            return
+        if self.col < self.col_end:
+            self.col += 1
+            return
+        self.col = self.col_start
+        if self.mode == 0x00:
+            self.page = self.page + 1 if self.page < self.page_end else self.page_start
+
+    def pixel(self, x, y):
+        return (self.ram[(y >> 3) * self.width + x] >> (y & 7)) & 1
+
+
+class Counters:
+    # bus traffic accounting shared by the fake buses
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0
+        self.bytes = 0
+
+
+class FakeI2C:
+    # stand-in for machine.I2C/SoftI2C with one GDDRAM per address
+    def __init__(self, width=128, pages=8, addrs=(0x3C,)):
+        self.devices = {addr: GDDRAM(width, pages) for addr in addrs}
+        self.counters = Counters()
+
+    def writeto(self, addr, buf, stop=True):
+        self.writevto(addr, (buf,), stop)
+        return len(buf)
+
+    def writevto(self, addr, bufs, stop=True):
+        device = self.devices[addr]
+        stream = b"".join(bytes(b) for b in bufs)
+        self.counters.transactions += 1
+        self.counters.bytes += len(stream) + 1  # plus the address byte
+        i = 0
+        while i < len(stream):
+            control = stream[i]
+            i += 1
+            if control & 0x40:
+                for byte in stream[i:]:
+                    device.data(byte)
+                return
+            if control & 0x80:
+                device.command(stream[i])
+                i += 1
+                continue
+            for byte in stream[i:]:
+                device.command(byte)
+            return
+
+
+class FakePin:
+    # stand-in for machine.Pin used as an output
+    OUT = 1
+    IN = 0
+
+    def __init__(self, value=0):
+        self._value = value
+
+    def init(self, mode=None, value=None, **kwargs):
+        if value is not None:
+            self._value = value
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = v
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+
+class FakeSPI:
+    # stand-in for machine.SPI wired to one SSD1306 through dc/cs pins
+    def __init__(self, dc, cs, width=128, pages=8):
+        self.dc = dc
+        self.cs = cs
+        self.device = GDDRAM(width, pages)
+        self.counters = Counters()
+        self.inits = 0
+
+    def init(self, **kwargs):
+        self.inits += 1
+
+    def write(self, buf):
+        if self.cs() != 0:
+            return
+        self.counters.transactions += 1
+        self.counters.bytes += len(buf)
+        handler = self.device.data if self.dc() else self.device.command
+        for byte in bytes(buf):
+            handler(byte)
+
+
+def same_image(display, device):
+    # true when the panel RAM matches the driver's framebuffer
+    return bytes(display.buffer) == bytes(device.ram[: len(display.buffer)])
@@ -0,0 +1,118 @@
+# Pure-Python stand-in for MicroPython's framebuf module (host side only)
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+
+    def _get(self, x, y):
+        if self.format == MONO_VLSB:
+            return (self.buf[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+        index = (y * self.stride + x) >> 3
+        if self.format == MONO_HLSB:
+            return (self.buf[index] >> (7 - (x & 7))) & 1
+        return (self.buf[index] >> (x & 7)) & 1
+
+    def _set(self, x, y, c):
+        if self.format == MONO_VLSB:
+            index = (y >> 3) * self.stride + x
+            mask = 1 << (y & 7)
+        else:
+            index = (y * self.stride + x) >> 3
+            if self.format == MONO_HLSB:
+                mask = 0x80 >> (x & 7)
+            else:
+                mask = 1 << (x & 7)
+        if c:
+            self.buf[index] |= mask
+        else:
+            self.buf[index] &= ~mask & 0xFF
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill(self, c):
+        v = 0xFF if c else 0x00
+        for i in range(len(self.buf)):
+            self.buf[i] = v
+
+    def fill_rect(self, x, y, w, h, c):
+        for yy in range(max(y, 0), min(y + h, self.height)):
+            for xx in range(max(x, 0), min(x + w, self.width)):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x0, y0, c)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def text(self, s, x, y, c=1):
+        # Not the real 8x8 font: each glyph is a deterministic 8x8 pattern
+        # derived from its code point, which is enough for byte accounting.
+        for ch in s:
+            code = ord(ch)
+            if ch != " ":
+                for col in range(8):
+                    bits = ((code * (col + 3)) ^ (code >> 1)) & 0x7E
+                    for row in range(8):
+                        if (bits >> row) & 1:
+                            self.pixel(x + col, y + row, c)
+            x += 8
+
+    def scroll(self, xstep, ystep):
+        w, h = self.width, self.height
+        pixels = [[self._get(x, y) for x in range(w)] for y in range(h)]
+        for y in range(h):
+            for x in range(w):
+                sx, sy = x - xstep, y - ystep
+                if 0 <= sx < w and 0 <= sy < h:
+                    self._set(x, y, pixels[sy][sx])
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for sy in range(fbuf.height):
+            for sx in range(fbuf.width):
+                c = fbuf._get(sx, sy)
+                if palette is not None:
+                    c = palette._get(c, 0)
+                if c != key:
+                    self.pixel(x + sx, y + sy, c)
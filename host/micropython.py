@@ -0,0 +1,16 @@
+# Pure-Python stand-in for the MicroPython micropython module (host side only)
+
+
+def const(value):
+    return value
+
+
+def schedule(func, arg):
+    func(arg)
+
+
+def native(func):
+    return func
+
+
+viper = native
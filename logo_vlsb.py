@@ -0,0 +1,39 @@
+# Archivo generado por empaquetar_imagenes.py a partir de logo.py, no editar a mano
+# Imagen de 128x64 píxeles en formato MONO_VLSB (páginas de 8 filas), lista para oled.blit_pages()
+
+LOGO_ANCHO = 128
+LOGO_ALTO = 64
+LOGO_VLSB = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xee\xce\x9e\xee\x8e\xfe\xee\xfe\xfe\xfe\xfe\xfe\xbe\xfe\xfe\xfe'
+    b'\xfe\xbe\xae\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x7f\x7f\x7f\x7f\x7f{{c\x7f\x7f\xff\xff'
+    b'\xf3\xe7\xf3\xff\xf7\xef\xff\xff\xff\xf7\xff\xef\xef\xf7\xfb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x9f\xcf\xe7\xf3\xfb\xf9\xfd\xfc\xfe\xf2\xfe\xfe\xff\xff\xff\xff\xff\xef\xe6\xfe\xfe\xfe'
+    b'\xfc\xfd\xf9{3\xa7O\x9f?\x7f\xff\xfb\xfc\xf8\xff\xff\xfb\xff\xff\xff\xff\xfb\xfb\xfc\xfc\xf9\xff\xff\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\xc0\xf0\xfc\xff\xff\xff\xfb\xff\xff\xff\xff\xff\xff\xff\x0f\x03\x07\x03\x03\x01\x01\x01\x00\x00\x00\x01'
+    b'\x1f??\xff\xef\xff\xfe\xff\xbc\xb0\xf1\xc3\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x80\x80\x80\x00\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\x06\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\xf7\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x81\x03\x07\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x03\x13\t\x03\x083\xcf?\x7f\xff\xff\xff\xff\xff\xff \x80\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x80\x80'
+    b'\xc0\xc0\xc0\x80\x00\xc0\xc0\xe1\xff?\xcfc\x1c\x03\x81#\x87\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x01\x00\x00\x04#F}\xfb\xf7'o_\xdf\xbf\xbf?\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f?\xbf"
+    b'\xbf\x9f_of\xb6;\r\x06C\x80\xc0\xe4\xf3\xdc\xfe\xff\xdf\xdf\xff\xff\xdf\xff\xff\xdf\xff\xdf\xdf\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f~}|{xtprhiaaaqcsqqi`hh'
+    b'xtwzz}}~~\x7f\x7f}\x7f\x7f}\x7f\x7f\x7f}}\x7f\x7f}\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
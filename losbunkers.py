@@ -14,7 +14,8 @@
 from machine import Pin, SoftI2C
 from MPU6050 import MPU6050 # Se importa la clase MPU6050 para controlar el giroscopio/acelerómetro MPU6050
 from ssd1306 import SSD1306_I2C # Se importa la clase SSD1306_I2C para controlar la pantalla OLED
-from game_assets import enemy, qaim, aim, bunker, Aim, Enemy, Bunker # Se importan los sprites y clases del juego
+from game_assets import Aim, Enemy, Bunker # Se importan las clases del juego
+from game_sprites import enemy, qaim, aim, bunker # Se importan los sprites ya empaquetados como FrameBuffers
 import time # Se importa el módulo time para manejo de pausas y tiempos
 import random # Se importa random para generar comportamiento aleatorio de los enemigos
 import math # Se importa math para cálculos matemáticos (magnitud vectorial del acelerómetro)
@@ -125,19 +126,12 @@ def init_enemies():
 # Función para renderizar/dibujar un sprite (matriz de píxeles) en la pantalla OLED
 def render_item(x, y, item):
     # x, y: coordenadas de inicio donde dibujar el sprite
-    # item: matriz bidimensional que representa el sprite (8x8 píxeles)
+    # item: sprite empaquetado como FrameBuffer (ver game_sprites.py)
 
     global oled # Variable global de la pantalla OLED
-    
-    # Itera sobre cada fila de la matriz del sprite
-    for row in item:
-        # Itera sobre cada píxel de la fila actual
-        for pixel in row:
-            # Dibuja el píxel en la posición (x, y) con el valor del pixel (0 o 1)
-            oled.pixel(x,y,pixel)
-            x += 1 # Avanza a la siguiente posición horizontal
-        x -= len(row) # Regresa x al inicio de la fila
-        y += 1 # Avanza a la siguiente fila (incrementa y)
+
+    # Copia el sprite completo con una sola llamada nativa en lugar de dibujarlo píxel por píxel
+    oled.blit(item, x, y)
 
 # Función para manejar el movimiento de la mira usando el giroscopio MPU6050
 def handle_aim():
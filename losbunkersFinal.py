@@ -9,24 +9,40 @@
 # para controlar la mira mediante movimientos físicos, un botón para disparar, y una pantalla OLED para visualizar el juego.
 # El jugador puede alternar entre control por giroscopio o joystick presionando el botón SW del joystick.
 
-# Se importan las clases Pin, SoftI2C y ADC del módulo machine. Pin se usa para controlar los pines GPIO,
-# SoftI2C implementa el protocolo de comunicación I2C por software, y ADC permite leer señales analógicas
-from machine import Pin, SoftI2C, ADC
-from MPU6050 import MPU6050 # Se importa la clase MPU6050 para controlar el giroscopio/acelerómetro MPU6050
-from ssd1306 import SSD1306_I2C # Se importa la clase SSD1306_I2C para controlar la pantalla OLED
-from game_assets import enemy, qaim, aim, bunker, Aim, Enemy, Bunker # Se importan los sprites y clases del juego
+# Se importan las clases Pin, I2C y ADC del módulo machine. Pin se usa para controlar los pines GPIO,
+# I2C usa el periférico I2C por hardware del ESP32, y ADC permite leer señales analógicas
+from machine import Pin, I2C, ADC
+from MPU6050 import MPU6050, _DLPF_21HZ # Se importa la clase MPU6050 para controlar el giroscopio/acelerómetro MPU6050
+from ssd1306 import SSD1306_I2C, FrameClock # Se importa la clase SSD1306_I2C para controlar la pantalla OLED y FrameClock para el ritmo de cuadros
+from game_assets import Aim, Enemy, Bunker # Se importan las clases del juego
+from game_sprites import enemy, aim, bunker, qaim_x3 # Se importan los sprites ya empaquetados como FrameBuffers
 import time # Se importa el módulo time para manejo de pausas y tiempos
 import random # Se importa random para generar comportamiento aleatorio de los enemigos
 import math # Se importa math para cálculos matemáticos (magnitud vectorial del acelerómetro)
+from array import array # Se importa array para guardar las lecturas del sensor sin crear objetos nuevos cada cuadro
 
-# Configuración del I2C con los pines GPIO18 (SCL, línea de reloj) y GPIO19 (SDA, línea de datos)
-i2c = SoftI2C(scl=Pin(18), sda=Pin(19))
+# Configuración del I2C por hardware a 400 kHz con los pines GPIO18 (SCL, línea de reloj) y GPIO19 (SDA, línea de datos).
+# La pantalla OLED y el MPU6050 comparten este mismo bus (el MPU6050 se conecta también a GPIO18/GPIO19),
+# lo que hace cada transferencia unas 4 veces más rápida que el SoftI2C a 100 kHz y libera los pines GPIO21/GPIO22
+i2c = I2C(0, scl=Pin(18), sda=Pin(19), freq=400000)
 # Inicialización de la pantalla OLED con resolución 128x64 píxeles usando I2C
 oled = SSD1306_I2C(128, 64, i2c)
 
 # Configuración de los pines de entrada del juego
 button = Pin(16, Pin.IN, Pin.PULL_UP) # Botón de disparo en GPIO16 con resistencia pull-up interna
-mpu = MPU6050() # Instancia del sensor MPU6050
+mpu = MPU6050(i2c) # Instancia del sensor MPU6050 sobre el bus compartido con la pantalla
+mpu.set_dlpf(_DLPF_21HZ) # El filtro pasa bajas del propio sensor elimina el ruido del giroscopio
+mpu.set_sample_rate(50) # 50 muestras por segundo, más que los 20 cuadros por segundo del juego
+
+# Calibración del giroscopio: los offsets se guardan en la memoria flash (mpu6050.cal), así que solo
+# la primera vez se miden, con el control quieto. Se restan en cada lectura y eliminan el drift
+if not mpu.load_calibration():
+    oled.fill(0)
+    oled.text("Calibrando...", 12, 24)
+    oled.text("No mover", 32, 36)
+    oled.show()
+    if mpu.calibrate(accel=False): # Solo se guarda si se pudo leer el sensor, si no se intenta de nuevo al reiniciar
+        mpu.save_calibration()
 
 # Configuración del joystick analógico (ejes x, y)
 joystick_x = ADC(Pin(34)) # Eje x del joystick conectado al GPIO34
@@ -89,7 +105,8 @@ joystick_button.irq(trigger=Pin.IRQ_FALLING, handler=handle_mode_change)
 
 # Parámetros de configuración del giroscopio
 gyro_sensitivity = 3  # Factor de movimiento por lectura del giroscopio
-gyro_deadzone = 0.08    # Zona muerta para evitar drift del giroscopio
+gyro_deadzone = 0.02    # Zona muerta pequeña solo para el ruido; el drift lo corrige la calibración
+lectura = array('f', [0.0] * 7) # Lectura del MPU6050: ax, ay, az, temperatura, gx, gy, gz (se reutiliza en cada cuadro)
 
 # Variables de control del modo de entrada
 control_mode = "gyro"  # Modo de control inicial
@@ -219,38 +236,8 @@ def reset_game():
 def render_item(x, y, item):
     global oled
     
-    # Dibuja un ítem (matriz) en las coordenadas (x,y)
-    for row in item:
-        # Dibuja cada fila de la matriz
-        for pixel in row:
-            # Dibuja cada píxel de la fila
-            oled.pixel(x,y,pixel)
-            x += 1 # Avanza al siguiente píxel en x
-        x -= len(row) # Regresa al inicio de la fila
-        y += 1 # Baja a la siguiente fila
-
-# Función para aumentar el tamaño de una matriz
-def aumentar_matriz(matriz, factor):
-    # matriz: matriz bidimensional original
-    # factor: número de veces que se repetirá cada píxel
-    # Retorna: matriz ampliada
-
-    # Si el factor es menor que 1, no se aumenta
-    if factor < 1:
-        return matriz
-    
-    nuevo_icono = [] # Nueva matriz aumentada
-    
-    # Repite cada fila y cada columna según el factor
-    for fila in matriz:
-        nueva_fila = []
-        # Repite cada píxel en la fila
-        for c in fila:
-            nueva_fila.extend([c] * factor)
-        for _ in range(factor): # Repite la fila completa
-            nuevo_icono.append(nueva_fila)
-    
-    return nuevo_icono # Retorna la matriz aumentada
+    # Dibuja un sprite empaquetado (ver game_sprites.py) en las coordenadas (x,y) con un solo blit
+    oled.blit(item, x, y)
 
 # Función para leer el joystick analógico
 def read_joystick():
@@ -290,8 +277,10 @@ def handle_aim():
     
     if control_mode == "gyro":
         # Modo giroscopio con movimiento incremental controlado
-        gyro = mpu.read_gyro_data()
-        gx, gy = gyro["x"], gyro["y"]
+        # Lee acelerómetro, temperatura y giroscopio en una sola transacción I2C, sin pausas,
+        # directo al arreglo preasignado (sin crear diccionarios en cada cuadro)
+        mpu.read_all_into(lectura)
+        gx, gy = lectura[4], lectura[5]
 
         # Zona muerta para evitar drift
         if abs(gx) < gyro_deadzone: gx = 0
@@ -313,16 +302,14 @@ def handle_aim():
                 player.y = max(2, player.y - gyro_sensitivity)
         
         # Lee acelerómetro para detectar movimiento rápido y agrandar mira
-        accel = mpu.read_accel_data()
-        ax, ay, az = accel["x"], accel["y"], accel["z"]
+        ax, ay, az = lectura[0], lectura[1], lectura[2]
         magnitude = math.sqrt(ax**2+ay**2+az**2)
 
         # Si detecta movimiento rápido, agranda la mira
         if magnitude > 1.3:
             quick_move_active = True
             # Mira agrandada para cubrir más área
-            aim_large = aumentar_matriz(qaim, 3)  
-            render_item(player.x - 6, player.y - 6, aim_large)
+            render_item(player.x - 6, player.y - 6, qaim_x3)
         else:
             quick_move_active = False
             # Mira normal
@@ -390,6 +377,10 @@ def game_over():
 init_bunkers() # Crea búnkers
 init_enemies() # Crea enemigos
 presentation() # Muestra presentación
+
+# Reloj de cuadros a 20 FPS: espera solo el tiempo que falta para completar cada cuadro de 50 ms
+# en lugar de dormir 50 ms fijos además del tiempo que ya tomó dibujar y leer los sensores
+reloj = FrameClock(20)
         
 # Bucle principal del juego
 while True:
@@ -410,7 +401,7 @@ while True:
             oled.text(f"P:{points}", 0, 0)
 
         oled.show() # Actualiza pantalla
-        time.sleep(0.05)
+        reloj.wait() # Espera hasta el inicio del siguiente cuadro
     else:
         # Si el juego terminó, espera reinicio
         time.sleep(0.1)
\ No newline at end of file
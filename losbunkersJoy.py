@@ -12,7 +12,8 @@
 from machine import Pin, SoftI2C, ADC
 from MPU6050 import MPU6050 # Se importa la clase MPU6050 para controlar el giroscopio/acelerómetro MPU6050
 from ssd1306 import SSD1306_I2C # Se importa la clase SSD1306_I2C para controlar la pantalla OLED
-from game_assets import enemy, qaim, aim, bunker, Aim, Enemy, Bunker # Se importan los sprites y clases del juego
+from game_assets import Aim, Enemy, Bunker # Se importan las clases del juego
+from game_sprites import enemy, qaim, aim, bunker # Se importan los sprites ya empaquetados como FrameBuffers
 import time # Se importa el módulo time para manejo de pausas y tiempos
 import random # Se importa random para generar comportamiento aleatorio de los enemigos
 import math # Se importa math para cálculos matemáticos (magnitud vectorial del acelerómetro)
@@ -26,6 +27,16 @@ oled = SSD1306_I2C(128, 64, i2c)
 button = Pin(16, Pin.IN, Pin.PULL_UP) # Botón de disparo en GPIO16 con resistencia pull-up interna
 mpu = MPU6050() # Instancia del sensor MPU6050 (giroscopio + acelerómetro)
 
+# Calibración del giroscopio: los offsets se guardan en la memoria flash (mpu6050.cal), así que solo
+# la primera vez se miden, con el control quieto. Se restan en cada lectura y eliminan el drift
+if not mpu.load_calibration():
+    oled.fill(0)
+    oled.text("Calibrando...", 12, 24)
+    oled.text("No mover", 32, 36)
+    oled.show()
+    if mpu.calibrate(accel=False): # Solo se guarda si se pudo leer el sensor, si no se intenta de nuevo al reiniciar
+        mpu.save_calibration()
+
 # Configuración del joystick analógico (ejes X e Y)
 joystick_x = ADC(Pin(34)) # Eje X del joystick conectado al GPIO34
 joystick_x.atten(ADC.ATTN_11DB) # Configura atenuación para rango 0-3.3V
@@ -96,7 +107,7 @@ joystick_button.irq(trigger=Pin.IRQ_FALLING, handler=handle_mode_change)
 
 # Parámetros de configuración del giroscopio para el control de la mira
 gyro_sensitivity = 0.5  # Sensibilidad del giroscopio (0.5 = normal, 1.0 = rápida)
-gyro_deadzone = 0.02    # Zona muerta para evitar drift (movimiento no intencional por ruido del sensor)
+gyro_deadzone = 0.01    # Zona muerta pequeña solo para el ruido; el drift lo corrige la calibración
 
 # Variables de control del modo de entrada
 control_mode = "gyro"  # Modo de control: "gyro" para giroscopio, "joystick" para joystick analógico
@@ -181,18 +192,13 @@ def init_enemies():
 # Función para renderizar/dibujar un sprite (matriz de píxeles) en la pantalla OLED
 def render_item(x, y, item):
     """
-    Dibuja un sprite en la pantalla OLED píxel por píxel
+    Dibuja un sprite en la pantalla OLED con un solo blit
     x, y: coordenadas de inicio donde dibujar el sprite
-    item: matriz bidimensional que representa el sprite (8x8 píxeles)
+    item: sprite empaquetado como FrameBuffer (ver game_sprites.py)
     """
     global oled
-    
-    for row in item:
-        for pixel in row:
-            oled.pixel(x,y,pixel)
-            x += 1
-        x -= len(row)
-        y += 1
+
+    oled.blit(item, x, y)
 
 # Función para leer y procesar los valores del joystick analógico
 def read_joystick():
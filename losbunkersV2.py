@@ -12,7 +12,8 @@
 from machine import Pin, SoftI2C, ADC
 from MPU6050 import MPU6050 # Se importa la clase MPU6050 para controlar el giroscopio/acelerómetro MPU6050
 from ssd1306 import SSD1306_I2C # Se importa la clase SSD1306_I2C para controlar la pantalla OLED
-from game_assets import enemy, qaim, aim, bunker, Aim, Enemy, Bunker # Se importan los sprites y clases del juego
+from game_assets import Aim, Enemy, Bunker # Se importan las clases del juego
+from game_sprites import enemy, qaim, aim, bunker # Se importan los sprites ya empaquetados como FrameBuffers
 import time # Se importa el módulo time para manejo de pausas y tiempos
 import random # Se importa random para generar comportamiento aleatorio de los enemigos
 import math # Se importa math para cálculos matemáticos (magnitud vectorial del acelerómetro)
@@ -241,16 +242,11 @@ def reset_game():
 # Función para renderizar sprites en pantalla
 def render_item(x, y, item):
     """
-    Dibuja un sprite píxel por píxel
+    Dibuja un sprite empaquetado (ver game_sprites.py) con un solo blit
     """
     global oled
-    
-    for row in item:
-        for pixel in row:
-            oled.pixel(x,y,pixel)
-            x += 1
-        x -= len(row)
-        y += 1
+
+    oled.blit(item, x, y)
 
 # Función para leer el joystick analógico
 def read_joystick():
@@ -1,7 +1,9 @@
 # MicroPython SSD1306 OLED driver, I2C and SPI interfaces
 
+import micropython
 from micropython import const
 import framebuf
+import time
 
 
 # register definitions
@@ -12,6 +14,9 @@ SET_DISP = const(0xAE)
 SET_MEM_ADDR = const(0x20)
 SET_COL_ADDR = const(0x21)
 SET_PAGE_ADDR = const(0x22)
+SET_PAGE_START = const(0xB0)
+SET_COL_LOW = const(0x00)
+SET_COL_HIGH = const(0x10)
 SET_DISP_START_LINE = const(0x40)
 SET_SEG_REMAP = const(0xA0)
 SET_MUX_RATIO = const(0xA8)
@@ -22,6 +27,38 @@ SET_DISP_CLK_DIV = const(0xD5)
 SET_PRECHARGE = const(0xD9)
 SET_VCOM_DESEL = const(0xDB)
 SET_CHARGE_PUMP = const(0x8D)
+SET_HSCROLL_RIGHT = const(0x26)
+SET_HSCROLL_LEFT = const(0x27)
+SET_VHSCROLL_RIGHT = const(0x29)
+SET_VHSCROLL_LEFT = const(0x2A)
+SET_VSCROLL_AREA = const(0xA3)
+SET_SCROLL = const(0x2E)
+
+# in page addressing mode a changed page is split into separate spans where the
+# unchanged gap is longer than this, moving the pointer is cheaper than resending
+PAGE_GAP = const(8)
+
+# frames between scroll steps -> interval code of the scroll setup commands
+SCROLL_FRAMES = {2: 0x07, 3: 0x04, 4: 0x05, 5: 0x00, 25: 0x06, 64: 0x01, 128: 0x02, 256: 0x03}
+
+# command sequences of these types go to the bus as they are, built once here
+# instead of on every isinstance() call
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
+@micropython.native
+def changed_span(buf, shadow, start, end):
+    # first and last index in start..end-1 where buf differs from shadow, packed as
+    # first << 16 | last (-1 when equal); compares in place, no slices are allocated
+    while start < end and buf[start] == shadow[start]:
+        start += 1
+    if start == end:
+        return -1
+    end -= 1
+    while buf[end] == shadow[end]:
+        end -= 1
+    return start << 16 | end
+
 
 # Subclassing FrameBuffer provides support for graphics primitives
 # http://docs.micropython.org/en/latest/pyboard/library/framebuf.html
@@ -32,43 +69,56 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        # copy of the panel contents, used by show() to send only what changed
+        self.shadow = bytearray(len(self.buffer))
+        # show_page/show_region read from src/view, show_async points them at a snapshot
+        self.src = self.buffer
+        self.view = memoryview(self.buffer)
+        self.front = None
+        self.flushing = False
+        self.stale = True
+        self.scrolling = False
+        self.page_mode = False
+        self.pointer_cmds = bytearray(3)
+        self.window_cmds = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
     def init_display(self):
-        for cmd in (
-            SET_DISP | 0x00,  # off
-            # address setting
-            SET_MEM_ADDR,
-            0x00,  # horizontal
-            # resolution and layout
-            SET_DISP_START_LINE | 0x00,
-            SET_SEG_REMAP | 0x01,  # column addr 127 mapped to SEG0
-            SET_MUX_RATIO,
-            self.height - 1,
-            SET_COM_OUT_DIR | 0x08,  # scan from COM[N] to COM0
-            SET_DISP_OFFSET,
-            0x00,
-            SET_COM_PIN_CFG,
-            0x02 if self.width > 2 * self.height else 0x12,
-            # timing and driving scheme
-            SET_DISP_CLK_DIV,
-            0x80,
-            SET_PRECHARGE,
-            0x22 if self.external_vcc else 0xF1,
-            SET_VCOM_DESEL,
-            0x30,  # 0.83*Vcc
-            # display
-            SET_CONTRAST,
-            0xFF,  # maximum
-            SET_ENTIRE_ON,  # output follows RAM contents
-            SET_NORM_INV,  # not inverted
-            # charge pump
-            SET_CHARGE_PUMP,
-            0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+        self.write_cmds(
+            (
+                SET_DISP | 0x00,  # off
+                # address setting
+                SET_MEM_ADDR,
+                0x02 if self.page_mode else 0x00,  # page or horizontal
+                # resolution and layout
+                SET_DISP_START_LINE | 0x00,
+                SET_SEG_REMAP | 0x01,  # column addr 127 mapped to SEG0
+                SET_MUX_RATIO,
+                self.height - 1,
+                SET_COM_OUT_DIR | 0x08,  # scan from COM[N] to COM0
+                SET_DISP_OFFSET,
+                0x00,
+                SET_COM_PIN_CFG,
+                0x02 if self.width > 2 * self.height else 0x12,
+                # timing and driving scheme
+                SET_DISP_CLK_DIV,
+                0x80,
+                SET_PRECHARGE,
+                0x22 if self.external_vcc else 0xF1,
+                SET_VCOM_DESEL,
+                0x30,  # 0.83*Vcc
+                # display
+                SET_CONTRAST,
+                0xFF,  # maximum
+                SET_ENTIRE_ON,  # output follows RAM contents
+                SET_NORM_INV,  # not inverted
+                # charge pump
+                SET_CHARGE_PUMP,
+                0x10 if self.external_vcc else 0x14,
+                SET_DISP | 0x01,  # on
+            )
+        )
         self.fill(0)
         self.show()
 
@@ -79,26 +129,307 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds((SET_CONTRAST, contrast))
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    def enable_stats(self, on=True):
+        # count flushes, bytes and time spent on the bus; the counters wrap the
+        # write methods per instance so they cost nothing while disabled
+        if on:
+            self.reset_stats()
+            self.show = self._counted_show
+            self.write_cmd = self._counted_cmd
+            self.write_cmds = self._counted_cmds
+            self.write_data = self._counted_data
+        else:
+            for name in ("show", "write_cmd", "write_cmds", "write_data"):
+                try:
+                    delattr(self, name)
+                except AttributeError:
+                    pass
+
+    def reset_stats(self):
+        self.flushes = 0
+        self.bytes_sent = 0
+        self.cmd_us = 0
+        self.data_us = 0
+        self.max_frame_us = 0
+
+    def _counted_show(self, full=False):
+        t = time.ticks_us()
+        type(self).show(self, full)
+        t = time.ticks_diff(time.ticks_us(), t)
+        self.flushes += 1
+        if t > self.max_frame_us:
+            self.max_frame_us = t
+
+    def _counted_cmd(self, cmd):
+        t = time.ticks_us()
+        type(self).write_cmd(self, cmd)
+        self.cmd_us += time.ticks_diff(time.ticks_us(), t)
+        self.bytes_sent += 1
+
+    def _counted_cmds(self, cmds):
+        t = time.ticks_us()
+        type(self).write_cmds(self, cmds)
+        self.cmd_us += time.ticks_diff(time.ticks_us(), t)
+        self.bytes_sent += len(cmds)
+
+    def _counted_data(self, buf):
+        t = time.ticks_us()
+        type(self).write_data(self, buf)
+        self.data_us += time.ticks_diff(time.ticks_us(), t)
+        self.bytes_sent += len(buf)
+
+    def set_page_mode(self, on=True):
+        # page addressing: each upload only moves the page/column pointer (3 command
+        # bytes) instead of programming a window, the cheapest way to send a few
+        # short spans; horizontal addressing is better for large regions
+        self.write_cmds((SET_MEM_ADDR, 0x02 if on else 0x00))
+        self.page_mode = on
+
+    def invalidate(self):
+        # forget what the panel shows, the next show() resends everything
+        self.stale = True
+
+    def blit_pages(self, data, width, x=0, page=0):
+        # copy an image already in this display's MONO_VLSB page layout straight
+        # into the buffer at column x and page `page`, one slice per page
+        src = memoryview(data)
+        buf = self.buffer
+        w = min(width, self.width - x)
+        for p in range(min(len(data) // width, self.pages - page)):
+            dst = (page + p) * self.width + x
+            buf[dst : dst + w] = src[p * width : p * width + w]
+
+    def blit_rle(self, data, x=0, page=0):
+        # draw an image compressed by empaquetar_imagenes.rle_encode(): a 3 byte header
+        # (0x52, width, pages) then PackBits style packets over MONO_VLSB bytes, decoded
+        # straight into the buffer at column x and page `page` (clipped to the display)
+        if data[0] != 0x52:
+            raise ValueError("not an RLE image")
+        width = data[1]
+        total = width * data[2]
+        src = memoryview(data)
+        buf = self.buffer
+        i = 3
+        out = 0
+        while out < total:
+            n = data[i]
+            i += 1
+            literal = n < 128
+            count = n + 1 if literal else n - 126
+            if not literal:
+                value = data[i]
+                i += 1
+            while count:
+                row = out // width
+                col = out - row * width
+                span = min(count, width - col)  # rest of this page row
+                visible = min(span, self.width - x - col)
+                if visible > 0 and page + row < self.pages:
+                    dst = (page + row) * self.width + x + col
+                    if literal:
+                        buf[dst : dst + visible] = src[i : i + visible]
+                    else:
+                        for k in range(dst, dst + visible):
+                            buf[k] = value
+                if literal:
+                    i += span
+                out += span
+                count -= span
+
+    def load_rle(self, path, x=0, page=0):
+        # only the compressed file is held in RAM while it is decoded
+        with open(path, "rb") as f:
+            self.blit_rle(f.read(), x, page)
+
+    def hw_scroll_h(self, left=False, page0=0, page1=None, frames=5):
+        # continuous horizontal scroll of pages page0..page1, done by the controller
+        if page1 is None:
+            page1 = self.pages - 1
+        self.write_cmds(
+            (
+                SET_SCROLL | 0x00,  # setup is only allowed while stopped
+                SET_HSCROLL_LEFT if left else SET_HSCROLL_RIGHT,
+                0x00,
+                page0,
+                self._scroll_interval(frames),
+                page1,
+                0x00,
+                0xFF,
+            )
+        )
+        self.hw_scroll_start()
+
+    def hw_scroll_diag(self, dy=1, left=False, page0=0, page1=None, frames=5, top=0, rows=None):
+        # horizontal scroll of pages page0..page1 combined with a vertical scroll of
+        # dy rows per step inside the area of `rows` rows below `top` fixed rows
+        if page1 is None:
+            page1 = self.pages - 1
+        if rows is None:
+            rows = self.height - top
+        self.write_cmds(
+            (
+                SET_SCROLL | 0x00,
+                SET_VSCROLL_AREA,
+                top,
+                rows,
+                SET_VHSCROLL_LEFT if left else SET_VHSCROLL_RIGHT,
+                0x00,
+                page0,
+                self._scroll_interval(frames),
+                page1,
+                dy,
+            )
+        )
+        self.hw_scroll_start()
+
+    def hw_scroll_start(self):
+        self.write_cmd(SET_SCROLL | 0x01)
+        self.scrolling = True
+
+    def hw_scroll_stop(self):
+        self.write_cmd(SET_SCROLL | 0x00)
+        self.scrolling = False
+        # scrolling moves the display RAM, it has to be rewritten afterwards
+        self.stale = True
+
+    def _scroll_interval(self, frames):
+        try:
+            return SCROLL_FRAMES[frames]
+        except KeyError:
+            raise ValueError("frames must be one of 2, 3, 4, 5, 25, 64, 128, 256")
+
+    def show(self, full=False):
+        if self.scrolling:
+            if not full and not self.stale and self.buffer == self.shadow:
+                # nothing new was drawn, leave the scroll running with no bus traffic
+                return
+            # the RAM must not be written while the controller scrolls it
+            self.hw_scroll_stop()
+        if full or self.stale:
+            self.show_region(0, self.width - 1, 0, self.pages - 1)
+            self.stale = False
+            return
+        for page in range(self.pages):
+            self.show_page(page)
+
+    async def show_async(self):
+        # flush page by page and yield to the scheduler between pages. The frame is
+        # first copied into a second buffer, so the app can go on drawing frame N+1
+        # into self.buffer (e.g. after asyncio.create_task(oled.show_async()))
+        # while frame N is still being sent
+        import asyncio
+
+        while self.flushing:
+            await asyncio.sleep(0)
+        self.flushing = True
+        if self.front is None:
+            self.front = bytearray(len(self.buffer))
+        front = self.front
+        front[:] = self.buffer
+        try:
+            if self.scrolling:
+                self.hw_scroll_stop()
+            self.src = front
+            self.view = memoryview(front)
+            for page in range(self.pages):
+                if self.stale:
+                    self.show_region(0, self.width - 1, page, page)
+                else:
+                    self.show_page(page)
+                await asyncio.sleep(0)
+            self.stale = False
+        finally:
+            self.src = self.buffer
+            self.view = memoryview(self.buffer)
+            self.flushing = False
+
+    def show_page(self, page):
+        # send the changed column span of one page, returns the bytes sent
+        buf = self.src
+        shadow = self.shadow
+        first = page * self.width
+        span = changed_span(buf, shadow, first, first + self.width)
+        if span < 0:
+            return 0
+        start = span >> 16
+        end = span & 0xFFFF
+        if not self.page_mode:
+            self.show_region(start - first, end - first, page, page)
+            return end - start + 1
+        # split the changed range at long unchanged gaps
+        sent = 0
+        run = start
+        last = start
+        for i in range(start + 1, end + 1):
+            if buf[i] != shadow[i]:
+                if i - last > PAGE_GAP:
+                    self.show_span(page, run - first, last - first)
+                    sent += last - run + 1
+                    run = i
+                last = i
+        self.show_span(page, run - first, last - first)
+        return sent + last - run + 1
+
+    def show_region(self, x0, x1, page0, page1):
+        # upload columns x0..x1 of pages page0..page1: the address window is set once
+        # and every page row goes out as a memoryview slice of the buffer, so no
+        # pixel data is copied (full-width regions are a single contiguous slice)
+        if self.page_mode:
+            for page in range(page0, page1 + 1):
+                self.show_span(page, x0, x1)
+            return
+        self.set_window(x0, x1, page0, page1)
+        view = self.view
+        shadow = self.shadow
+        if x0 == 0 and x1 == self.width - 1:
+            row = view[page0 * self.width : (page1 + 1) * self.width]
+            self.write_data(row)
+            shadow[page0 * self.width : (page1 + 1) * self.width] = row
+            return
+        for page in range(page0, page1 + 1):
+            start = page * self.width + x0
+            row = view[start : start + x1 - x0 + 1]
+            self.write_data(row)
+            shadow[start : start + x1 - x0 + 1] = row
+
+    def show_span(self, page, x0, x1):
+        # page addressing mode only: move the pointer to (page, x0), send x0..x1
+        start = page * self.width + x0
+        row = self.view[start : start + x1 - x0 + 1]
+        if self.width == 64:
+            # displays with width of 64 pixels are shifted by 32
+            x0 += 32
+        cmds = self.pointer_cmds
+        cmds[0] = SET_PAGE_START | page
+        cmds[1] = SET_COL_LOW | (x0 & 0x0F)
+        cmds[2] = SET_COL_HIGH | (x0 >> 4)
+        self.write_cmds(cmds)
+        self.write_data(row)
+        self.shadow[start : start + len(row)] = row
+
+    def set_window(self, x0, x1, page0, page1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        cmds = self.window_cmds
+        cmds[1] = x0
+        cmds[2] = x1
+        cmds[4] = page0
+        cmds[5] = page1
+        self.write_cmds(cmds)
+
+    def write_cmds(self, cmds):
+        # fallback for interfaces without a batched command path
+        # (calls the class method, the stats wrappers count each command only once)
+        write_cmd = type(self).write_cmd
+        for cmd in cmds:
+            write_cmd(self, cmd)
 
 
 class SSD1306_I2C(SSD1306):
@@ -107,6 +438,10 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.cmd_buf = bytearray(33)  # Co=0, D/C#=0 followed by up to 32 commands
+        self.cmd_view = memoryview(self.cmd_buf)
+        # a view per sequence length, write_cmds() sends them without allocating
+        self.cmd_views = [self.cmd_view[:n] for n in range(34)]
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
@@ -114,13 +449,25 @@ class SSD1306_I2C(SSD1306):
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, cmds):
+        # a whole command sequence in one transaction
+        buf = self.cmd_buf
+        n = 0
+        for cmd in cmds:
+            if n == 32:
+                self.i2c.writeto(self.addr, buf)
+                n = 0
+            n += 1
+            buf[n] = cmd
+        self.i2c.writeto(self.addr, self.cmd_views[n + 1])
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, shared=False):
         self.rate = 10 * 1024 * 1024
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
@@ -129,8 +476,12 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
-        import time
-
+        # only reconfigure the bus per transfer when other devices share it
+        self.shared = shared
+        self.cmd_buf = bytearray(32)
+        self.cmd_view = memoryview(self.cmd_buf)
+        self.cmd_one = self.cmd_view[:1]  # write_cmd() sends this, no view per command
+        spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.res(1)
         time.sleep_ms(1)
         self.res(0)
@@ -139,17 +490,243 @@ class SSD1306_SPI(SSD1306):
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cmd_buf[0] = cmd
+        # the class method, so enable_stats() does not count the command twice
+        type(self).write_cmds(self, self.cmd_one)
+
+    def write_cmds(self, cmds):
+        # the whole sequence goes out under one CS assertion
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        if isinstance(cmds, BUFFER_TYPES):
+            self.spi.write(cmds)
+        else:
+            buf = self.cmd_buf
+            n = 0
+            for cmd in cmds:
+                if n == 32:
+                    self.spi.write(buf)
+                    n = 0
+                buf[n] = cmd
+                n += 1
+            self.spi.write(self.cmd_view[:n])
         self.cs(1)
 
     def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(1)
         self.cs(0)
         self.spi.write(buf)
         self.cs(1)
+
+
+class DisplayManager:
+    # Several SSD1306_I2C panels sharing one bus object. flush() visits the pages of
+    # all panels in turn and sends only their changed spans (see show_page), so the
+    # panels are updated interleaved rather than one whole frame after the other.
+    # With a byte budget it stops early and resumes where it left off on the next
+    # call; whatever was not sent stays dirty in the panel's shadow copy.
+    def __init__(self, i2c):
+        self.i2c = i2c
+        self.panels = []
+        self.cursor = 0
+
+    def add(self, width, height, addr=0x3C, external_vcc=False):
+        panel = SSD1306_I2C(width, height, self.i2c, addr, external_vcc)
+        self.panels.append(panel)
+        return panel
+
+    def flush(self, budget=None):
+        # returns the number of data bytes sent
+        panels = self.panels
+        if not panels:
+            return 0
+        sent = 0
+        for panel in panels:
+            if budget is not None and sent >= budget:
+                break
+            if panel.stale or panel.scrolling:
+                # show() leaves a running marquee alone until something new is drawn on it
+                panel.show()
+                if not panel.scrolling:
+                    sent += len(panel.buffer)
+        slots = len(panels) * max(panel.pages for panel in panels)
+        for _ in range(slots):
+            if budget is not None and sent >= budget:
+                break
+            page, n = divmod(self.cursor, len(panels))
+            self.cursor = (self.cursor + 1) % slots
+            panel = panels[n]
+            if page < panel.pages and not panel.scrolling:
+                sent += panel.show_page(page)
+        return sent
+
+
+class FrameClock:
+    # Deadline based frame pacing: wait() only sleeps for what is left of the
+    # frame period, so the loop keeps a steady rate however long the frame took.
+    def __init__(self, fps):
+        self.period = 1000000 // fps
+        self.frames = 0
+        self.late = 0
+        self.start = time.ticks_us()
+        self.deadline = time.ticks_add(self.start, self.period)
+
+    def wait(self):
+        now = time.ticks_us()
+        left = time.ticks_diff(self.deadline, now)
+        if left > 0:
+            time.sleep_us(left)
+            self.deadline = time.ticks_add(self.deadline, self.period)
+        else:
+            # frame overran, restart the schedule instead of rushing to catch up
+            self.late += 1
+            self.deadline = time.ticks_add(now, self.period)
+        self.frames += 1
+
+    def fps(self):
+        # average rate since the last call
+        now = time.ticks_us()
+        elapsed = time.ticks_diff(now, self.start)
+        rate = self.frames * 1000000 / elapsed if elapsed > 0 else 0
+        self.frames = 0
+        self.start = now
+        return rate
+
+
+class GlyphCache:
+    # Large text: each (character, scale) glyph is rendered from the built-in 8x8
+    # font once, packed into a MONO_VLSB FrameBuffer and kept in an LRU cache
+    # bounded by `budget` bytes, so drawing a string costs one blit per character.
+    def __init__(self, budget=2048):
+        self.budget = budget
+        self.used = 0
+        self.tick = 0
+        self.cache = {}  # key -> [framebuffer, size, last use]
+        self.src = framebuf.FrameBuffer(bytearray(8), 8, 8, framebuf.MONO_VLSB)
+
+    def glyph(self, ch, scale):
+        if not 0 < scale < 8:
+            # the key keeps the scale in 3 bits, a larger one would hit another glyph
+            raise ValueError("scale must be between 1 and 7")
+        key = ord(ch) << 3 | scale
+        self.tick += 1
+        entry = self.cache.get(key)
+        if entry is not None:
+            entry[2] = self.tick
+            return entry[0]
+        size = 8 * scale * scale
+        while self.cache and self.used + size > self.budget:
+            self._evict()
+        src = self.src
+        src.fill(0)
+        src.text(ch, 0, 0, 1)
+        fb = framebuf.FrameBuffer(bytearray(size), 8 * scale, 8 * scale, framebuf.MONO_VLSB)
+        for y in range(8):
+            for x in range(8):
+                if src.pixel(x, y):
+                    fb.fill_rect(x * scale, y * scale, scale, scale, 1)
+        self.cache[key] = [fb, size, self.tick]
+        self.used += size
+        return fb
+
+    def _evict(self):
+        oldest = None
+        for key, entry in self.cache.items():
+            if oldest is None or entry[2] < self.cache[oldest][2]:
+                oldest = key
+        self.used -= self.cache.pop(oldest)[1]
+
+    def text(self, display, s, x, y, scale=2):
+        # draws the lit pixels of each glyph, the background is left untouched
+        step = 8 * scale
+        for ch in s:
+            if ch != " ":
+                display.blit(self.glyph(ch, scale), x, y, 0)
+            x += step
+
+
+class StripChart:
+    # Rolling chart drawn as a sweep: each sample replaces one column at a moving
+    # cursor instead of shifting the whole plot left, so show() only has to send
+    # the cursor columns. (SET_DISP_START_LINE scrolls rows, not columns, so the
+    # controller cannot shift a chart sideways by itself.)
+    def __init__(self, display, x, y, width, height, lo, hi):
+        self.display = display
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.lo = lo
+        self.hi = hi
+        self.col = 0
+        self.last_top = None
+        self.last_bottom = None
+
+    def clear(self):
+        self.display.fill_rect(self.x, self.y, self.width, self.height, 0)
+        self.col = 0
+        self.last_top = None
+
+    def row(self, value):
+        value = min(max(value, self.lo), self.hi)
+        return self.y + self.height - 1 - int((value - self.lo) * (self.height - 1) / (self.hi - self.lo))
+
+    def add(self, value):
+        y = self.row(value)
+        self.plot(y, y)
+
+    def plot(self, top, bottom):
+        # fill rows top..bottom of the cursor column, stretched to touch the previous
+        # column so the trace stays connected
+        x = self.x + self.col
+        display = self.display
+        display.vline(x, self.y, self.height, 0)
+        if self.col and self.last_top is not None:
+            if top > self.last_bottom:
+                top = self.last_bottom
+            if bottom < self.last_top:
+                bottom = self.last_top
+        display.vline(x, top, bottom - top + 1, 1)
+        if self.col + 1 < self.width:
+            display.vline(x + 1, self.y, self.height, 0)  # cursor gap
+        self.last_top = top
+        self.last_bottom = bottom
+        self.col = (self.col + 1) % self.width
+
+
+class MinMaxChart(StripChart):
+    # Strip chart for series sampled faster than the screen refreshes: samples
+    # are folded into a min/max bucket for the cursor column and each column is
+    # drawn as a vertical span from min to max, so short spikes stay visible no
+    # matter how many samples land in one column. With per_column=None columns
+    # are only drawn by commit(), e.g. once per screen refresh.
+    def __init__(self, display, x, y, width, height, lo, hi, per_column=None):
+        super().__init__(display, x, y, width, height, lo, hi)
+        self.per_column = per_column
+        self.count = 0
+        self.vmin = 0
+        self.vmax = 0
+
+    def add(self, value):
+        if self.count == 0:
+            self.vmin = self.vmax = value
+        elif value < self.vmin:
+            self.vmin = value
+        elif value > self.vmax:
+            self.vmax = value
+        self.count += 1
+        if self.per_column is not None and self.count >= self.per_column:
+            self.commit()
+
+    def commit(self):
+        # draw the current bucket and start the next column
+        if self.count == 0:
+            return
+        self.plot(self.row(self.vmax), self.row(self.vmin))
+        self.count = 0
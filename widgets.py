@@ -0,0 +1,148 @@
+# Small widget layer over the SSD1306 driver
+#
+# Each widget owns a rectangle of the screen and is only redrawn when its value
+# actually changes. Screen.update() redraws the changed widgets and uploads just
+# the columns and pages they cover with show_region(), instead of the usual
+# fill(0) / redraw everything / show() cycle.
+
+
+class Widget:
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.value = None
+        self.dirty = True
+
+    def set(self, value):
+        if value != self.value:
+            self.value = value
+            self.dirty = True
+
+    def draw(self, display):
+        display.fill_rect(self.x, self.y, self.w, self.h, 0)
+        self.render(display)
+        self.dirty = False
+
+    def render(self, display):
+        pass
+
+
+class Label(Widget):
+    # fixed-width text; chars is the number of characters the rectangle fits
+    def __init__(self, x, y, text="", chars=None):
+        super().__init__(x, y, 8 * (chars or len(text)), 8)
+        self.value = text
+
+    def render(self, display):
+        # clipped to the rectangle, only the rectangle is cleared and uploaded
+        display.text(self.value[: self.w // 8], self.x, self.y, 1)
+
+
+class Value(Label):
+    # formatted number, redrawn only when the formatted text changes
+    def __init__(self, x, y, fmt="{}", chars=6):
+        super().__init__(x, y, "", chars)
+        self.fmt = fmt
+
+    def set(self, value):
+        super().set(self.fmt.format(value))
+
+
+class Bar(Widget):
+    # horizontal bar graph of value within lo..hi, redrawn only when the filled
+    # width in pixels changes
+    def __init__(self, x, y, w, h, lo=0, hi=100):
+        super().__init__(x, y, w, h)
+        self.lo = lo
+        self.hi = hi
+
+    def set(self, value):
+        value = min(max(value, self.lo), self.hi)
+        super().set(int((value - self.lo) * (self.w - 2) / (self.hi - self.lo)))
+
+    def render(self, display):
+        display.rect(self.x, self.y, self.w, self.h, 1)
+        if self.value:
+            display.fill_rect(self.x + 1, self.y + 1, self.value, self.h - 2, 1)
+
+
+class Sparkline(Widget):
+    # the last w samples of a series as a line, scaled to lo..hi
+    def __init__(self, x, y, w, h, lo=0, hi=100):
+        super().__init__(x, y, w, h)
+        self.lo = lo
+        self.hi = hi
+        self.samples = bytearray(w)  # y offsets inside the rectangle
+        self.count = 0
+        self.head = 0
+
+    def push(self, value):
+        value = min(max(value, self.lo), self.hi)
+        dy = self.h - 1 - int((value - self.lo) * (self.h - 1) / (self.hi - self.lo))
+        self.samples[self.head] = dy
+        self.head = (self.head + 1) % self.w
+        if self.count < self.w:
+            self.count += 1
+        self.dirty = True
+
+    def set(self, value):
+        self.push(value)
+
+    def render(self, display):
+        samples = self.samples
+        first = (self.head - self.count) % self.w
+        x = self.x + self.w - self.count
+        prev = samples[first]
+        for i in range(self.count):
+            dy = samples[(first + i) % self.w]
+            display.line(x + i - 1 if i else x, self.y + prev, x + i, self.y + dy, 1)
+            prev = dy
+
+
+class Icon(Widget):
+    # a packed FrameBuffer sprite (see game_sprites.pack), set() swaps the sprite
+    def __init__(self, x, y, sprite, w, h):
+        super().__init__(x, y, w, h)
+        self.value = sprite
+
+    def render(self, display):
+        if self.value is not None:
+            display.blit(self.value, self.x, self.y)
+
+
+class Screen:
+    def __init__(self, display):
+        self.display = display
+        self.widgets = []
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def redraw(self):
+        # draw every widget and resend the whole screen, e.g. when switching screens
+        display = self.display
+        display.fill(0)
+        for widget in self.widgets:
+            widget.draw(display)
+        display.show(True)
+
+    def update(self):
+        # redraw the widgets whose value changed and upload only their rectangles,
+        # returns how many widgets were refreshed
+        display = self.display
+        refreshed = 0
+        for widget in self.widgets:
+            if not widget.dirty:
+                continue
+            widget.draw(display)
+            x0 = max(widget.x, 0)
+            x1 = min(widget.x + widget.w, display.width) - 1
+            page0 = max(widget.y, 0) // 8
+            page1 = (min(widget.y + widget.h, display.height) - 1) // 8
+            if x0 <= x1 and page0 <= page1:
+                display.show_region(x0, x1, page0, page1)
+            refreshed += 1
+        return refreshed